@@ -0,0 +1,216 @@
+"""
+Benchmark the exact cover solvers on Sudoku boards and on the N-queens problem.
+
+Each solver is compiled from the same reduced matrix.
+The compile time is measured separately from the time to find the first solution (or all solutions).
+
+The recursive engine is the former implementation of `Matrix.algorithm_x`,
+which yields each solution through a chain of nested generators.
+It is kept here to compare against the iterative implementation.
+
+With --corpus, the dict solver runs over a corpus of Sudoku boards instead,
+once deterministically and once with each restart schedule (see `solve_with_restarts`).
+Backtracking has heavy-tailed run times, so the report shows the median, the 90th percentile and the worst case.
+
+With --stats, the search statistics of each instance and engine are written to a JSON file (see `SearchStats`),
+which can be compared across runs.
+
+See the argparse description for more.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from local.exact_cover import Matrix, SearchStats, parallel_algorithm_x, queens_matrix, solve_with_restarts
+from local.sudoku import Board
+
+ENGINES = ["recursive", "dict", "dlx", "bitset"]
+
+HARD = Board([
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 3, 0, 8, 5],
+    [0, 0, 1, 0, 2, 0, 0, 0, 0],
+    [0, 0, 0, 5, 0, 7, 0, 0, 0],
+    [0, 0, 4, 0, 0, 0, 1, 0, 0],
+    [0, 9, 0, 0, 0, 0, 0, 0, 0],
+    [5, 0, 0, 0, 0, 0, 0, 7, 3],
+    [0, 0, 2, 0, 1, 0, 0, 0, 0],
+    [0, 0, 0, 0, 4, 0, 0, 0, 9]
+])
+"""
+A Sudoku designed to work against the brute force algorithm (same as in `TestBoard.test_solve_hard`).
+"""
+
+
+class RecursiveSolver:
+    """
+    Former, recursive implementation of `Matrix.algorithm_x`.
+    """
+    def __init__(self, matrix: Matrix):
+        self.matrix = matrix
+
+    def algorithm_x(self, selected_rows: List) -> Iterator[List]:
+        matrix = self.matrix
+        if matrix.is_empty():
+            yield selected_rows
+            return
+
+        c = matrix.choose_column()
+        for r in matrix.choose_row(c):
+            selected_rows.append(r)
+            removed_cols = matrix.cover_column(r)
+            try:
+                for solution in self.algorithm_x(selected_rows):
+                    yield solution
+            finally:
+                matrix.uncover_column(removed_cols)
+            selected_rows.pop()
+
+
+def compile_solver(matrix: Matrix, engine: str):
+    if engine == "recursive":
+        return RecursiveSolver(matrix)
+    return matrix.compile(engine)
+
+
+def sudoku(board: Board) -> Callable[[], Matrix]:
+    return board.to_matrix
+
+
+def random_sudoku(dim: int, seed: int) -> Callable[[], Matrix]:
+    def build() -> Matrix:
+        random.seed(seed)
+        return Board.random(dim).to_matrix()
+    return build
+
+
+def queens(n: int) -> Callable[[], Matrix]:
+    return lambda: queens_matrix(n)
+
+
+INSTANCES: Dict[str, Tuple[Callable[[], Matrix], bool]] = {
+    "sudoku 9x9 hard": (sudoku(HARD), False),
+    "sudoku 16x16": (random_sudoku(4, 0), False),
+    "sudoku 25x25": (random_sudoku(5, 0), False),
+    "sudoku 36x36": (random_sudoku(6, 0), False),
+    "8-queens (all)": (queens(8), True),
+    "10-queens (all)": (queens(10), True),
+    "20-queens": (queens(20), False),
+}
+"""
+Maps each instance name to a function that builds the matrix and to whether all solutions are enumerated.
+"""
+
+
+def benchmark(name: str, engines: List[str], workers: int, report: Optional[Dict[str, Dict]] = None):
+    """
+    Solve the instance with each engine and print the measurements.
+
+    With more than one worker, each engine also runs in parallel mode.
+    With a report, the search statistics of each engine are added to it (except for the recursive engine).
+    """
+    build, all_solutions = INSTANCES[name]
+    for engine in engines:
+        matrix = build()
+        start = time.perf_counter()
+        solver = compile_solver(matrix, engine)
+        compile_time = time.perf_counter() - start
+
+        stats = SearchStats() if report is not None and engine != "recursive" else None
+        options = {"stats": stats} if stats is not None else {}
+        start = time.perf_counter()
+        try:
+            if all_solutions:
+                n_solutions = sum(1 for _ in solver.algorithm_x([], **options))
+            else:
+                next(solver.algorithm_x([], **options))
+                n_solutions = 1
+        except RecursionError:
+            print(f"{name:<18} {engine:<12} {'recursion limit exceeded':>36}")
+            continue
+        solve_time = time.perf_counter() - start
+        print(f"{name:<18} {engine:<12} {n_solutions:>10} {compile_time * 1000:>12.1f} {solve_time * 1000:>12.1f}")
+        if stats is not None:
+            report.setdefault(name, {})[engine] = stats.to_dict()
+
+        if workers > 1 and engine != "recursive":
+            start = time.perf_counter()
+            solutions = parallel_algorithm_x(matrix, workers, engine=engine, first=not all_solutions)
+            if all_solutions:
+                n_solutions = sum(1 for _ in solutions)
+            else:
+                next(solutions)
+                solutions.close()
+            solve_time = time.perf_counter() - start
+            print(f"{name:<18} {f'{engine} x{workers}':<12} {n_solutions:>10} {'':>12} {solve_time * 1000:>12.1f}")
+
+
+def corpus(n: int) -> List[Tuple[str, Callable[[], Matrix]]]:
+    """
+    Return a corpus of Sudoku boards: the hard board,
+    and n boards with random presets of each size from 9x9 to 25x25.
+    """
+    instances = [("sudoku 9x9 hard", sudoku(HARD))]
+    for dim in (3, 4, 5):
+        for seed in range(n):
+            instances.append((f"sudoku {dim ** 2}x{dim ** 2} #{seed}", random_sudoku(dim, seed)))
+    return instances
+
+
+def worst_case(n: int, workers: int):
+    """
+    Solve each board of the corpus with each strategy and print the distribution of solve times.
+    """
+    strategies = {
+        "deterministic": lambda matrix: next(matrix.algorithm_x([])),
+        "luby": lambda matrix: solve_with_restarts(matrix, "luby", seed=0),
+        "geometric": lambda matrix: solve_with_restarts(matrix, "geometric", seed=0),
+    }
+    if workers > 1:
+        strategies[f"luby x{workers}"] = lambda matrix: solve_with_restarts(matrix, "luby", seed=0, workers=workers)
+
+    instances = corpus(n)
+    print(f"{'strategy':<14} {'#boards':>8} {'median (ms)':>12} {'p90 (ms)':>12} {'max (ms)':>12}  worst board")
+    for name, solve in strategies.items():
+        times = []
+        for _, build in instances:
+            matrix = build()
+            start = time.perf_counter()
+            solve(matrix)
+            times.append(time.perf_counter() - start)
+
+        p90 = statistics.quantiles(times, n=10)[-1]
+        worst = max(range(len(times)), key=lambda i: times[i])
+        print(f"{name:<14} {len(times):>8} {statistics.median(times) * 1000:>12.1f} {p90 * 1000:>12.1f} "
+              f"{times[worst] * 1000:>12.1f}  {instances[worst][0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the exact cover solvers on Sudoku boards and on the N-queens problem."
+    )
+    parser.add_argument("--engine", choices=ENGINES, action="append",
+                        help="Solver to benchmark (repeat for several); defaults to all")
+    parser.add_argument("--instance", choices=INSTANCES.keys(), action="append",
+                        help="Instance to solve (repeat for several); defaults to all")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Also run each engine in parallel mode with this many worker processes")
+    parser.add_argument("--corpus", type=int, metavar="N",
+                        help="Report worst-case solve times over a corpus of N random boards per size instead")
+    parser.add_argument("--stats", metavar="PATH",
+                        help="Write the search statistics of each instance and engine to this JSON file")
+    args = parser.parse_args()
+
+    if args.corpus:
+        worst_case(args.corpus, args.workers)
+    else:
+        stats_report = {} if args.stats else None
+        print(f"{'instance':<18} {'engine':<12} {'#solutions':>10} {'compile (ms)':>12} {'solve (ms)':>12}")
+        for instance in args.instance or INSTANCES:
+            benchmark(instance, args.engine or ENGINES, args.workers, stats_report)
+        if args.stats:
+            with open(args.stats, "w") as f:
+                json.dump(stats_report, f, indent=2)
@@ -0,0 +1,66 @@
+"""
+Benchmark the cold-start time of importing each module in local.
+
+Each import runs in a fresh interpreter, so nothing is cached between measurements.
+The column "heavy" lists the heavy dependencies that were imported along the way.
+
+See the argparse description for more.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "local.rng",
+    "local.ec.core",
+    "local.ec.static",
+    "local.ec.util",
+    "local.ec.ipa",
+    "local.graph",
+    "local.stats",
+    "local.exact_cover",
+    "local.sudoku",
+    "local.primes",
+]
+HEAVY = ["numpy", "networkx", "matplotlib"]
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure(module: str, repeat: int):
+    """
+    Import the module in fresh interpreters and return the median time and the imported heavy dependencies.
+    """
+    times = []
+    heavy = ""
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        heavy = output[1] if len(output) > 1 else "-"
+    return statistics.median(times), heavy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the cold-start import time of each module in local."
+    )
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Number of fresh interpreters per module (the median is printed)")
+    parser.add_argument("modules", nargs="*", default=MODULES,
+                        help="Modules to import")
+    args = parser.parse_args()
+
+    print(f"{'module':<20} {'import (ms)':>12} heavy")
+    for module in args.modules:
+        elapsed, heavy = measure(module, args.repeat)
+        print(f"{module:<20} {elapsed * 1000:>12.1f} {heavy}")
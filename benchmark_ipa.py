@@ -0,0 +1,61 @@
+"""
+Benchmark the inner-product argument: proof size and verification time versus vector length.
+
+Revealing n openings costs 2 * n scalars (column #revealed).
+The inner-product argument costs 2 * log2(n) points and 2 scalars.
+
+See the argparse description for more.
+"""
+
+import argparse
+import time
+from local.ec import ipa
+from local.ec import core, static
+
+BACKENDS = {
+    "core": (core.AffinePoint, core.Scalar),
+    "static": (static.CurvePoint, static.Scalar),
+}
+
+
+def benchmark(log_n: int, point_cls, scalar_cls):
+    """
+    Prove and verify an inner product of vectors of length 2 ** log_n and print the measurements.
+    """
+    n = 2 ** log_n
+    gs = ipa.generators(n, "G", point_cls)
+    hs = ipa.generators(n, "H", point_cls)
+    u, = ipa.generators(1, "U", point_cls)
+    a = [int(scalar_cls.random()) for _ in range(n)]
+    b = [int(scalar_cls.random()) for _ in range(n)]
+    commitment = ipa.commit_inner_product(gs, hs, u, a, b)
+
+    start = time.perf_counter()
+    proof = ipa.InnerProductProof.prove(gs, hs, u, a, b)
+    prove_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = proof.verify(gs, hs, u, commitment)
+    verify_time = time.perf_counter() - start
+    assert valid
+
+    n_points, n_scalars = proof.size()
+    print(f"{n:>8} {n_points:>7} {n_scalars:>8} {2 * n:>10} {prove_time * 1000:>12.2f} {verify_time * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark proof size and verification time of the inner-product argument."
+    )
+    parser.add_argument("--backend", choices=BACKENDS.keys(), default="core",
+                        help="EC backend: core computes points, static looks them up")
+    parser.add_argument("--max-log-n", type=int, default=16,
+                        help="Largest vector length as a power of two")
+    args = parser.parse_args()
+
+    point_cls, scalar_cls = BACKENDS[args.backend]
+    print(f"Backend: {args.backend}")
+    print(f"{'n':>8} {'#points':>7} {'#scalars':>8} {'#revealed':>10} {'prove (ms)':>12} {'verify (ms)':>12}")
+
+    for log_n in range(0, args.max_log_n + 1):
+        benchmark(log_n, point_cls, scalar_cls)
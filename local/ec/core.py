@@ -2,6 +2,7 @@ import random
 from typing import Optional, Tuple, Union, List
 import hashlib
 import unittest
+from local import rng
 
 MAX_COORDINATE = 7
 MINUS_ONE_COORDINATE = MAX_COORDINATE - 1
@@ -79,7 +80,7 @@ class ModInt:
         """
         Return a uniformly random modular integer.
         """
-        return cls(random.randrange(cls.modulus))
+        return cls(rng.randrange(cls.modulus))
 
     def legendre_symbol(self) -> int:
         """
@@ -331,7 +332,7 @@ class AffinePoint:
 
         https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Double-and-add
         """
-        if ONE_POINT is None:
+        if one_point() is None:
             return None
 
         tmp = self
@@ -353,12 +354,13 @@ class AffinePoint:
 
         https://en.wikipedia.org/wiki/Pollard%27s_rho_algorithm_for_logarithms
         """
-        if ONE_POINT is None:
+        one = one_point()
+        if one is None:
             return None
 
         def step(p: AffinePoint, a: "Scalar", b: "Scalar") -> Tuple[AffinePoint, "Scalar", "Scalar"]:
             if p.is_zero() or p.x.value % 3 == 0:
-                return p + ONE_POINT, a + Scalar(1), b
+                return p + one, a + Scalar(1), b
             elif p.x.value % 3 == 1:
                 return p + self, a, b + Scalar(1)
             else:
@@ -373,11 +375,11 @@ class AffinePoint:
         for i in range(NUMBER_POINTS):
             # Loop invariant: p_i = ONE_POINT * a_i * self * b_i
             # Tortoise (gets a head start of i steps)
-            p1, a1, b1 = ONE_POINT * Scalar(i), Scalar(i), Scalar(0)
+            p1, a1, b1 = one * Scalar(i), Scalar(i), Scalar(0)
             # assert p1 == ONE_POINT * a1 + self * b1
 
             # Hare (starts at step 0)
-            p2, a2, b2 = ONE_POINT, Scalar(1), Scalar(0)
+            p2, a2, b2 = one, Scalar(1), Scalar(0)
             # assert p2 == ONE_POINT * a2 + self * b2
 
             # Guaranteed to halt because group is cyclic and finite
@@ -412,21 +414,21 @@ class AffinePoint:
 
         The integer n is internally scaled to the size of the curve.
         """
-        return ONE_POINT * Scalar.nth(n)
+        return one_point() * Scalar.nth(n)
 
     @classmethod
     def random(cls) -> "AffinePoint":
         """
         Return a uniformly random point on the curve.
         """
-        return ONE_POINT * Scalar(random.randrange(NUMBER_POINTS))
+        return one_point() * Scalar(rng.randrange(NUMBER_POINTS))
 
     @classmethod
     def sample_greater_one(cls, n_sample: int) -> "List[AffinePoint]":
         """
         Randomly sample distinct points on the curve that are greater than one (not zero and not one).
         """
-        return [ONE_POINT * Scalar(i) for i in random.sample(range(2, NUMBER_POINTS), n_sample)]
+        return [one_point() * Scalar(i) for i in random.sample(range(2, NUMBER_POINTS), n_sample)]
 
 
 ZERO_POINT = AffinePoint(None, None)
@@ -502,7 +504,7 @@ class TestAffinePoint(unittest.TestCase):
             self.assertTrue(minus_p.is_on_curve())
             self.assertEqual(p + minus_p, ZERO_POINT)
 
-            p += ONE_POINT
+            p += one_point()
 
         # p finished cycle through curve
         self.assertEqual(p, ZERO_POINT)
@@ -526,7 +528,7 @@ class TestAffinePoint(unittest.TestCase):
 
                 self.assertEqual(p_times_j, p_plus_dot_dot_dot_plus_p)
 
-            p += ONE_POINT
+            p += one_point()
 
         # p finished cycle through curve
         self.assertEqual(p, ZERO_POINT)
@@ -537,9 +539,9 @@ class TestAffinePoint(unittest.TestCase):
         for _ in range(NUMBER_POINTS):
             self.assertTrue(p.is_on_curve())
             k = p.discrete_log()
-            self.assertEqual(p, ONE_POINT * k)
+            self.assertEqual(p, one_point() * k)
 
-            p += ONE_POINT
+            p += one_point()
 
         # p finished cycle through curve
         self.assertEqual(p, ZERO_POINT)
@@ -557,22 +559,24 @@ def reset_one_point(point: AffinePoint):
     These methods will return different outputs for different definitions of the one-point.
     All previous results are invalid for a different one-point.
     """
-    global ONE_POINT
-    ONE_POINT = point
+    global _one_point, _one_point_computed
+    _one_point = point
+    _one_point_computed = True
 
 
 def number_points() -> Optional[int]:
     """
     Return the number of points on the curve.
     """
-    if ONE_POINT is None:
+    one = one_point()
+    if one is None:
         return None
 
-    minus_one_point = -ONE_POINT
+    minus_one_point = -one
     k = minus_one_point.discrete_log()
-    assert ONE_POINT * k == minus_one_point
-    assert ONE_POINT + minus_one_point == ZERO_POINT
-    assert minus_one_point + ONE_POINT == ZERO_POINT
+    assert one * k == minus_one_point
+    assert one + minus_one_point == ZERO_POINT
+    assert minus_one_point + one == ZERO_POINT
     return k.value + 1
 
 
@@ -582,7 +586,7 @@ class TestNumberPoints(unittest.TestCase):
         tmp = ZERO_POINT
 
         while True:
-            tmp += ONE_POINT
+            tmp += one_point()
             i += 1
 
             if tmp.is_zero():
@@ -666,11 +670,39 @@ class TestRandomPoints(unittest.TestCase):
 GLOBAL_POINTS = RandomPoints()
 """
 Global sequence of random non-zero curve points.
+
+The first point of the sequence is reserved for the one-point.
 """
-ONE_POINT = GLOBAL_POINTS.next()
-"""
-Global one-point.
-"""
+GLOBAL_POINTS.seed(1)
+
+_one_point: Optional[AffinePoint] = None
+_one_point_computed = False
+
+
+def one_point() -> Optional[AffinePoint]:
+    """
+    Return the global one-point.
+
+    The one-point is the first point of the global sequence of random points.
+    Finding it takes hashing and square roots, so it is computed on first use instead of at import.
+    """
+    global _one_point, _one_point_computed
+    if not _one_point_computed:
+        _one_point = RandomPoints().next()
+        _one_point_computed = True
+    return _one_point
+
+
+def __getattr__(name: str):
+    """
+    Compute module constants on first access (PEP 562).
+
+    This keeps `from local.ec.core import ONE_POINT` working.
+    Inside this module, use `one_point()` instead.
+    """
+    if name == "ONE_POINT":
+        return one_point()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Scalar(ModInt):
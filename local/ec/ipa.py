@@ -0,0 +1,306 @@
+"""
+Vector Pedersen commitments and the inner-product argument from Bulletproofs.
+
+https://eprint.iacr.org/2017/1066.pdf (Section 3)
+
+The argument convinces Victor that Peggy knows two vectors a and b
+such that a given point P is a commitment to a, b and their inner product <a, b>.
+The proof consists of 2 * log2(n) points and two scalars, where n is the length of the vectors.
+Peggy halves the vectors in each round, so the proof grows by two points each time n doubles.
+
+The argument is made non-interactive using the Fiat-Shamir heuristic:
+Victor's random challenges are replaced by hashes of the transcript.
+
+The argument is **not zero-knowledge** on its own: the final scalars leak information about a and b.
+
+All functions work with both EC backends.
+Scalars are plain integers modulo NUMBER_POINTS, which is the same for both backends.
+Points are only ever added, so the functions never need to know the scalar class of the backend.
+"""
+
+from typing import List, Optional, Sequence, Tuple, TypeVar
+import hashlib
+import unittest
+from local.ec.util import Scalar, Point, ONE_POINT, NUMBER_POINTS, multi_scalar_mul
+
+P = TypeVar("P")
+"""
+Point type of the chosen backend.
+"""
+
+
+def generators(n: int, label: str = "G", point_cls=Point) -> "List[P]":
+    """
+    Return n nonzero generators that are derived by hashing.
+
+    **Our curve is tiny, so generators repeat and their discrete logarithms are known!**
+    On a real curve, the generators would be independent.
+
+    :param n: number of generators
+    :param label: label that separates different lists of generators
+    :param point_cls: point class of the chosen backend
+    :return: list of generators
+    """
+    ret = []
+    for i in range(n):
+        h = hashlib.sha256("{}{}".format(label, i).encode()).digest()
+        k = 1 + int.from_bytes(h, byteorder="big") % (NUMBER_POINTS - 1)
+        ret.append(point_cls.nth(k))
+    return ret
+
+
+def inner_product(a: Sequence[int], b: Sequence[int]) -> int:
+    """
+    Return the inner product of two vectors of scalars modulo NUMBER_POINTS.
+    """
+    return sum(x * y for x, y in zip(a, b)) % NUMBER_POINTS
+
+
+class VectorOpening:
+    """
+    Opening of a vector Pedersen commitment to a list of values.
+
+    This generalizes `local.ec.util.Opening` from one value to many values:
+    Each value has its own generator, and a single blinding factor hides all of them.
+    """
+    vs: List[Scalar]
+    """
+    Contained values
+    """
+    r: Scalar
+    """
+    Blinding factor
+    """
+    gs: List[Point]
+    """
+    Generators for values
+    """
+    h: Point
+    """
+    Generator for blinding factor
+
+    **All generators must be independent from each other!**
+    """
+
+    def __init__(self, vs: List[Scalar], gs: List[Point], h: Point, r: Optional[Scalar] = None):
+        if len(vs) != len(gs):
+            raise ValueError("Need as many generators as values")
+        self.vs = vs
+        self.gs = gs
+        self.r = Scalar.random() if r is None else r
+        self.h = h
+
+    def __repr__(self) -> str:
+        return "{}: {}".format(self.values(), self.close())
+
+    def values(self) -> List[Scalar]:
+        return self.vs
+
+    def close(self) -> Point:
+        """
+        Return the commitment that corresponds to the opening.
+        """
+        return multi_scalar_mul([int(v) for v in self.vs] + [int(self.r)], self.gs + [self.h])
+
+    def verify(self, commitment: Point) -> bool:
+        """
+        Return whether the given commitment corresponds to this opening.
+        """
+        return commitment == self.close()
+
+
+def commit_inner_product(gs: "Sequence[P]", hs: "Sequence[P]", u: "P", a: Sequence[int], b: Sequence[int]) -> "P":
+    """
+    Return the commitment P = <a, gs> + <b, hs> + <a, b> * u.
+    """
+    scalars = list(a) + list(b) + [inner_product(a, b)]
+    return multi_scalar_mul(scalars, list(gs) + list(hs) + [u])
+
+
+def challenge(state: bytes, left, right) -> Tuple[bytes, int]:
+    """
+    Return the next Fiat-Shamir state and a nonzero challenge derived from it.
+
+    The point representation is the same for both backends.
+    """
+    state = hashlib.sha256(state + repr(left).encode() + repr(right).encode()).digest()
+    x = 1 + int.from_bytes(state, byteorder="big") % (NUMBER_POINTS - 1)
+    return state, x
+
+
+def initial_state(gs: "Sequence[P]", hs: "Sequence[P]", u: "P", commitment: "P") -> bytes:
+    """
+    Return the first Fiat-Shamir state, which binds the statement.
+
+    The statement consists of the length, all generators and the commitment.
+    Otherwise, the same proof could be replayed against different generators.
+    """
+    statement = [len(gs), list(gs), list(hs), u, commitment]
+    return hashlib.sha256(repr(statement).encode()).digest()
+
+
+class InnerProductProof:
+    """
+    Logarithmic-size proof that Peggy knows vectors a and b
+    such that P = <a, gs> + <b, hs> + <a, b> * u.
+    """
+    ls: List
+    """
+    Left cross-term of each round
+    """
+    rs: List
+    """
+    Right cross-term of each round
+    """
+    a: int
+    """
+    Folded vector a (single scalar)
+    """
+    b: int
+    """
+    Folded vector b (single scalar)
+    """
+
+    def __init__(self, ls: List, rs: List, a: int, b: int):
+        self.ls = ls
+        self.rs = rs
+        self.a = a
+        self.b = b
+
+    def __repr__(self) -> str:
+        return "L: {}, R: {}, a: {}, b: {}".format(self.ls, self.rs, self.a, self.b)
+
+    def size(self) -> Tuple[int, int]:
+        """
+        Return the number of points and the number of scalars in the proof.
+        """
+        return len(self.ls) + len(self.rs), 2
+
+    @classmethod
+    def prove(cls, gs: "Sequence[P]", hs: "Sequence[P]", u: "P", a: Sequence[int], b: Sequence[int]) -> "InnerProductProof":
+        """
+        Prove knowledge of a and b for the commitment P = <a, gs> + <b, hs> + <a, b> * u.
+
+        **The length of the vectors must be a power of two!**
+
+        :param gs: generators for a
+        :param hs: generators for b
+        :param u: generator for the inner product
+        :param a: first vector of scalars as integers
+        :param b: second vector of scalars as integers
+        :return: proof
+        """
+        n = len(a)
+        if n == 0 or n & (n - 1) != 0:
+            raise ValueError("Length must be a power of two")
+        if not (len(b) == len(gs) == len(hs) == n):
+            raise ValueError("Vectors and generators must have the same length")
+
+        q = NUMBER_POINTS
+        gs, hs = list(gs), list(hs)
+        a, b = [int(x) % q for x in a], [int(x) % q for x in b]
+        state = initial_state(gs, hs, u, commit_inner_product(gs, hs, u, a, b))
+        ls, rs = [], []
+
+        while n > 1:
+            n //= 2
+            a_lo, a_hi, b_lo, b_hi = a[:n], a[n:], b[:n], b[n:]
+            g_lo, g_hi, h_lo, h_hi = gs[:n], gs[n:], hs[:n], hs[n:]
+
+            c_left = inner_product(a_lo, b_hi)
+            c_right = inner_product(a_hi, b_lo)
+            left = multi_scalar_mul(a_lo + b_hi + [c_left], g_hi + h_lo + [u])
+            right = multi_scalar_mul(a_hi + b_lo + [c_right], g_lo + h_hi + [u])
+            ls.append(left)
+            rs.append(right)
+
+            state, x = challenge(state, left, right)
+            x_inv = pow(x, -1, q)
+
+            gs = [multi_scalar_mul([x_inv, x], [g_lo[i], g_hi[i]]) for i in range(n)]
+            hs = [multi_scalar_mul([x, x_inv], [h_lo[i], h_hi[i]]) for i in range(n)]
+            a = [(a_lo[i] * x + a_hi[i] * x_inv) % q for i in range(n)]
+            b = [(b_lo[i] * x_inv + b_hi[i] * x) % q for i in range(n)]
+
+        return InnerProductProof(ls, rs, a[0], b[0])
+
+    def verify(self, gs: "Sequence[P]", hs: "Sequence[P]", u: "P", commitment: "P") -> bool:
+        """
+        Verify the proof against the commitment P = <a, gs> + <b, hs> + <a, b> * u.
+
+        Instead of folding the generators round by round,
+        Victor computes the scalar of each generator after all rounds
+        and checks the entire equation with a single multi-scalar multiplication:
+
+        P + sum(L_j * x_j^2 + R_j * x_j^-2) = <s * a, gs> + <s^-1 * b, hs> + a * b * u,
+
+        where s_i is the product of x_j or x_j^-1, depending on the bits of i.
+
+        :param gs: generators for a
+        :param hs: generators for b
+        :param u: generator for the inner product
+        :param commitment: commitment P
+        :return: proof is valid
+        """
+        n = len(gs)
+        if len(hs) != n or len(self.ls) != len(self.rs) or 2 ** len(self.ls) != n:
+            return False
+
+        q = NUMBER_POINTS
+        state = initial_state(gs, hs, u, commitment)
+        xs = []
+        for left, right in zip(self.ls, self.rs):
+            state, x = challenge(state, left, right)
+            xs.append(x)
+
+        # The first round splits the vectors by the most significant bit of the index
+        s = [1]
+        for x in reversed(xs):
+            x_inv = pow(x, -1, q)
+            s = [v * x_inv % q for v in s] + [v * x % q for v in s]
+
+        scalars = [self.a * v % q for v in s] + [self.b * pow(v, -1, q) % q for v in s] + [self.a * self.b % q]
+        points = list(gs) + list(hs) + [u]
+        # Move the left-hand side to the right-hand side by negating its scalars
+        for x, left, right in zip(xs, self.ls, self.rs):
+            scalars.extend([-x * x % q, -pow(x, -2, q) % q])
+            points.extend([left, right])
+        scalars.append(q - 1)
+        points.append(commitment)
+
+        return multi_scalar_mul(scalars, points).is_zero()
+
+
+class TestInnerProductProof(unittest.TestCase):
+    def test_prove_verify(self):
+        for n in (1, 2, 8, 64):
+            gs, hs = generators(n, "G"), generators(n, "H")
+            u, = generators(1, "U")
+            a = [int(Scalar.random()) for _ in range(n)]
+            b = [int(Scalar.random()) for _ in range(n)]
+            commitment = commit_inner_product(gs, hs, u, a, b)
+
+            proof = InnerProductProof.prove(gs, hs, u, a, b)
+            self.assertEqual((2 * (n.bit_length() - 1), 2), proof.size())
+            self.assertTrue(proof.verify(gs, hs, u, commitment))
+
+            # Our curve is tiny, so each wrong commitment is accepted with probability 1 / NUMBER_POINTS
+            wrong = [commitment + ONE_POINT * Scalar(k) for k in range(1, NUMBER_POINTS)]
+            self.assertFalse(all(proof.verify(gs, hs, u, point) for point in wrong))
+
+    def test_initial_state(self):
+        gs, hs = generators(4, "G"), generators(4, "H")
+        u, = generators(1, "U")
+        commitment = commit_inner_product(gs, hs, u, [1, 2, 3, 4], [5, 6, 7, 8])
+        state = initial_state(gs, hs, u, commitment)
+        self.assertEqual(state, initial_state(tuple(gs), tuple(hs), u, commitment))
+        self.assertNotEqual(state, initial_state(gs[::-1], hs, u, commitment))
+        self.assertNotEqual(state, initial_state(gs, hs[::-1], u, commitment))
+        self.assertNotEqual(state, initial_state(gs, hs, u + u, commitment))
+        self.assertNotEqual(state, initial_state(gs[:2], gs[2:] + hs, u, commitment))
+
+    def test_vector_opening(self):
+        gs = generators(4)
+        h, = generators(1, "H")
+        opening = VectorOpening([Scalar.random() for _ in range(4)], gs, h)
+        self.assertTrue(opening.verify(opening.close()))
@@ -1,5 +1,6 @@
 import random
 import unittest
+from local import rng
 from typing import Tuple, Union, List, Iterable
 
 MAX_COORDINATE = 7
@@ -80,7 +81,7 @@ class CurvePoint:
         """
         Return a uniformly random point on the curve.
         """
-        return CurvePoint(random.randrange(NUMBER_POINTS))
+        return CurvePoint(rng.randrange(NUMBER_POINTS))
 
     @classmethod
     def sample_greater_one(cls, n_sample: int) -> "List[CurvePoint]":
@@ -193,7 +194,7 @@ class Scalar:
         """
         Return a uniformly random scalar.
         """
-        return Scalar(random.randrange(NUMBER_POINTS))
+        return Scalar(rng.randrange(NUMBER_POINTS))
 
     def serialize(self, compact: int = NUMBER_POINTS) -> int:
         """
@@ -1,15 +1,87 @@
-from typing import Tuple, List, Iterable
+from typing import Tuple, List, Iterable, Optional, Sequence
+from local import rng
 import unittest
+import math
 
 # Use this in conjunction with ec.core
-# from local.ec.core import Scalar, AffinePoint, ONE_POINT, NUMBER_POINTS
+# from local.ec.core import Scalar, AffinePoint, ONE_POINT, ZERO_POINT, NUMBER_POINTS
 # Point = AffinePoint
 
 # Use this in conjunction with ec.static
-from local.ec.static import Scalar, CurvePoint, ONE_POINT, NUMBER_POINTS
+from local.ec.static import Scalar, CurvePoint, ONE_POINT, ZERO_POINT, NUMBER_POINTS
 Point = CurvePoint
 
 
+BATCH_SECURITY_BITS = 8
+"""
+Default soundness of batch verification:
+A wrong opening is accepted with probability at most 2 ** (-BATCH_SECURITY_BITS).
+"""
+
+
+def sum_points(points: Iterable[Point]) -> Point:
+    """
+    Return the sum of the given points.
+
+    The sum of no points is the zero-point.
+    """
+    total = ZERO_POINT
+    for point in points:
+        total = total + point
+    return total
+
+
+def multi_scalar_mul(scalars: Sequence[int], points: Sequence[Point]) -> Point:
+    """
+    Return the sum of scalars[i] * points[i] (multi-scalar multiplication).
+
+    Uses the bucket method by Pippenger:
+    Each window of scalar bits sorts the points into buckets by their digit.
+    The buckets are combined using running sums, so each point costs a single point addition per window.
+    This is much cheaper than one scalar multiplication per point.
+    Doublings are additions of a point to itself, so the whole computation uses point additions only.
+
+    Works with the points of both EC backends.
+
+    https://eprint.iacr.org/2012/549.pdf (Section 4)
+
+    :param scalars: list of scalars as integers modulo NUMBER_POINTS
+    :param points: list of points (at least one)
+    :return: sum of scalar multiples
+    """
+    if len(scalars) != len(points):
+        raise ValueError("Need as many scalars as points")
+    if len(points) == 0:
+        raise ValueError("Need at least one point")
+
+    zero = points[0] - points[0]
+    scalars = [int(s) % NUMBER_POINTS for s in scalars]
+    n_bits = max(scalars).bit_length()
+    # Wider windows mean fewer rounds but more buckets to combine
+    window = max(1, min(n_bits, len(points).bit_length() - 2))
+    mask = (1 << window) - 1
+
+    result = zero
+    for shift in reversed(range(0, n_bits, window)):
+        for _ in range(window):
+            result = result + result
+
+        buckets = [zero] * (mask + 1)
+        for s, point in zip(scalars, points):
+            digit = (s >> shift) & mask
+            if digit != 0:
+                buckets[digit] = buckets[digit] + point
+
+        # Sum of digit * bucket[digit] using running sums
+        running, window_sum = zero, zero
+        for digit in range(mask, 0, -1):
+            running = running + buckets[digit]
+            window_sum = window_sum + running
+        result = result + window_sum
+
+    return result
+
+
 class Opening:
     """
     Opening of a cryptographic commitment to a value.
@@ -33,10 +105,10 @@ class Opening:
     **Both generators must be independent from each other!**
     """
 
-    def __init__(self, v: Scalar, g: Point, h: Point):
+    def __init__(self, v: Scalar, g: Point, h: Point, r: Optional[Scalar] = None):
         self.v = v
         self.g = g
-        self.r = Scalar.random()
+        self.r = Scalar.random() if r is None else r
         self.h = h
 
     def __repr__(self) -> str:
@@ -68,6 +140,106 @@ class Opening:
                 return False
         return True
 
+    @classmethod
+    def aggregate(cls, openings: "Iterable[Opening]") -> "Opening":
+        """
+        Return the opening of the sum of the commitments of the given openings.
+
+        Pedersen commitments are homomorphic:
+        The sum of commitments is a commitment to the sum of the values,
+        blinded by the sum of the blinding factors.
+
+        Use this for linear checks, such as "the values of this area sum up to x".
+        The verifier adds the commitments and checks a single opening.
+
+        **All openings must use the same generators!**
+        """
+        openings = list(openings)
+        if len(openings) == 0:
+            raise ValueError("Need at least one opening")
+        g, h = openings[0].g, openings[0].h
+        v, r = Scalar.nth(0), Scalar.nth(0)
+
+        for opening in openings:
+            if opening.g != g or opening.h != h:
+                raise ValueError("Can only aggregate openings with the same generators")
+            v = v + opening.v
+            r = r + opening.r
+
+        return Opening(v, g, h, r)
+
+    @classmethod
+    def batch_verify_aggregate(cls, openings: "List[Opening]", commitments: List[Point], coefficient_bits: int = 64,
+                               n_checks: Optional[int] = None) -> bool:
+        """
+        Verify that the list of openings opens to the list of commitments (in order),
+        using random linear combinations.
+
+        For each check, Victor picks a short random coefficient c_i for each position.
+        He compares sum(c_i * C_i) against the closed opening of (sum(c_i * v_i), sum(c_i * r_i)).
+        The left-hand side is one multi-scalar multiplication (see `multi_scalar_mul`), which uses point additions only.
+        The right-hand side is one closed opening, which costs two scalar multiplications.
+        Short coefficients keep the multi-scalar multiplication cheap.
+
+        The coefficients are drawn from m = min(2 ** coefficient_bits, NUMBER_POINTS) values.
+        If any opening is wrong, then each check misses it with probability at most 1 / m,
+        and all checks miss it with probability at most m ** (-n_checks).
+        By default, there are just enough checks to bring this below 2 ** (-BATCH_SECURITY_BITS).
+        On a real curve, a single check with 64-bit coefficients is plenty.
+        **Our curve is tiny, so each check misses with probability 1/13 and the default is 3 checks (1/2197)!**
+
+        Simply comparing the sum of all commitments would not be enough:
+        Peggy could swap values between openings and the sums would still match.
+
+        **All openings must use the same generators!**
+
+        :param openings: list of openings
+        :param commitments: list of commitments
+        :param coefficient_bits: length of the random coefficients
+        :param n_checks: number of random linear combinations; None for the default soundness
+        :return: openings are valid
+        """
+        assert len(openings) == len(commitments)
+        if len(openings) == 0:
+            return True
+        g, h = openings[0].g, openings[0].h
+        if any(opening.g != g or opening.h != h for opening in openings):
+            raise ValueError("Can only aggregate openings with the same generators")
+
+        m = min(2 ** coefficient_bits, NUMBER_POINTS)
+        if n_checks is None:
+            n_checks = math.ceil(BATCH_SECURITY_BITS / math.log2(m))
+
+        for _ in range(n_checks):
+            coefficients = [rng.randrange(m) for _ in openings]
+            v = sum(c * int(opening.v) for c, opening in zip(coefficients, openings)) % NUMBER_POINTS
+            r = sum(c * int(opening.r) for c, opening in zip(coefficients, openings)) % NUMBER_POINTS
+            combination = multi_scalar_mul(coefficients, commitments)
+            if not Opening(Scalar(v), g, h, Scalar(r)).verify(combination):
+                return False
+        return True
+
+    @classmethod
+    def verify_area(cls, openings: "List[Opening]", commitments: List[Point], values: Iterable[int], coefficient_bits: int = 64,
+                    n_checks: Optional[int] = None) -> bool:
+        """
+        Verify that the openings of an area (row, column or box) contain a permutation of the given values
+        and that they open to the commitments (in order).
+
+        The permutation check looks at the opened values.
+        The commitments are checked in aggregate (see `batch_verify_aggregate`).
+
+        :param openings: openings of the area
+        :param commitments: commitments of the area
+        :param values: values that the area must contain, in any order
+        :param coefficient_bits: length of the random coefficients
+        :param n_checks: number of random linear combinations; None for the default soundness
+        :return: area is valid
+        """
+        if sorted(int(opening.value()) for opening in openings) != sorted(values):
+            return False
+        return cls.batch_verify_aggregate(openings, commitments, coefficient_bits, n_checks)
+
     def serialize(self, compact: int = NUMBER_POINTS) -> Tuple[int, int]:
         """
         Serialize the opening as it would be broadcast in an interactive proof.
@@ -92,3 +264,40 @@ class TestOpening(unittest.TestCase):
         c2 = Opening(v, one_point, punto_uno)
 
         self.assertNotEquals(c1.close(), c2.close())
+
+    def test_aggregate(self):
+        punto_uno, = Point.sample_greater_one(1)
+        openings = [Opening(Scalar.random(), ONE_POINT, punto_uno) for _ in range(9)]
+        commitments = [opening.close() for opening in openings]
+
+        aggregate = Opening.aggregate(openings)
+        self.assertTrue(aggregate.verify(sum_points(commitments)))
+
+    def test_batch_verify_aggregate(self):
+        # Fixed seed: each call below gives the same result every time
+        rng.seed(0)
+        punto_uno = Point.nth(5)
+        openings = [Opening(Scalar.nth(value), ONE_POINT, punto_uno) for value in range(1, 10)]
+        commitments = [opening.close() for opening in openings]
+        self.assertTrue(Opening.batch_verify_aggregate(openings, commitments))
+        self.assertTrue(Opening.verify_area(openings, commitments, range(1, 10)))
+        self.assertFalse(Opening.verify_area(openings, commitments, range(2, 11)))
+
+        # Swap the values of the first two openings: The sum stays the same
+        swapped = [Opening(openings[1].v, ONE_POINT, punto_uno, openings[0].r),
+                   Opening(openings[0].v, ONE_POINT, punto_uno, openings[1].r)] + openings[2:]
+        self.assertTrue(Opening.aggregate(swapped).verify(sum_points(commitments)))
+        # Our curve is tiny, so each check misses the swap with probability 1/13
+        self.assertFalse(Opening.batch_verify_aggregate(swapped, commitments))
+        self.assertFalse(Opening.verify_area(swapped, commitments, range(1, 10)))
+        self.assertFalse(Opening.batch_verify_aggregate(swapped, commitments, n_checks=64))
+        rng.seed()
+
+
+class TestMultiScalarMul(unittest.TestCase):
+    def test_multi_scalar_mul(self):
+        for n in (1, 2, 5, 64, 300):
+            points = [ONE_POINT * Scalar.random() for _ in range(n)]
+            scalars = [Scalar.random() for _ in range(n)]
+            expected = sum_points(point * s for s, point in zip(scalars, points))
+            self.assertEqual(expected, multi_scalar_mul([int(s) for s in scalars], points))
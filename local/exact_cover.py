@@ -1,7 +1,17 @@
 from collections import defaultdict
-from typing import Set, List, Dict, TypeVar, Iterator, Generic
+from typing import Set, List, Dict, TypeVar, Iterator, Generic, Optional, Tuple, Union
+from local import rng
 import unittest
 import bisect
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import time
 
 Row = TypeVar("Row")
 """
@@ -12,6 +22,261 @@ Col = TypeVar("Col")
 Column label.
 """
 
+class BudgetExceeded(Exception):
+    """
+    The search selected more rows than its node budget allows.
+    """
+    pass
+
+
+class SearchStats:
+    """
+    Measurements of the work that one or more searches did.
+
+    Pass an instance to `algorithm_x` or `count_solutions` of any engine to fill it in:
+
+    stats = SearchStats()
+    solution = next(matrix.compile("dlx").algorithm_x([], stats=stats))
+    print(stats)
+
+    Without stats, the search only checks for None at each node, so there is practically no overhead.
+    Rows that are forced before the search are not counted.
+    """
+    nodes: int
+    """
+    Number of selected rows (nodes of the search tree)
+    """
+    backtracks: int
+    """
+    Number of times that the search returned to the previous level because all rows of a column were tried
+    """
+    covers: int
+    """
+    Number of covered columns
+    """
+    uncovers: int
+    """
+    Number of uncovered columns
+    """
+    max_depth: int
+    """
+    Largest number of rows that were selected at the same time
+    """
+    solutions: int
+    """
+    Number of found solutions
+    """
+    depth_time: List[float]
+    """
+    Maps each depth to the seconds that the search spent there
+    """
+    branching: List[int]
+    """
+    Maps each number of rows to the number of chosen columns with this many rows (branching factor histogram)
+
+    Chosen columns without rows are dead ends.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.covers = 0
+        self.uncovers = 0
+        self.max_depth = 0
+        self.solutions = 0
+        self.depth_time = [0.0]
+        self.branching = []
+        self._depth = 0
+        self._last = 0.0
+
+    def __repr__(self) -> str:
+        return "nodes: {}, backtracks: {}, covers: {}, uncovers: {}, max depth: {}, solutions: {}, time: {:.3f} s".format(
+            self.nodes, self.backtracks, self.covers, self.uncovers, self.max_depth, self.solutions, self.total_time())
+
+    def total_time(self) -> float:
+        """
+        Return the seconds that the search took.
+        """
+        return sum(self.depth_time)
+
+    def start(self):
+        """
+        Start measuring a search at the root.
+        """
+        self._depth = 0
+        self._last = time.perf_counter()
+
+    def stop(self):
+        """
+        Stop measuring the search.
+        """
+        self._charge(self._depth)
+
+    def choose(self, n_rows: int):
+        """
+        Record a chosen column with this many rows.
+        """
+        while len(self.branching) <= n_rows:
+            self.branching.append(0)
+        self.branching[n_rows] += 1
+
+    def select(self, depth: int, n_cols: int):
+        """
+        Record a selected row with this many columns; the search goes from depth to depth + 1.
+        """
+        self._charge(depth + 1)
+        self.nodes += 1
+        self.covers += n_cols
+        self.max_depth = max(self.max_depth, depth + 1)
+
+    def deselect(self, depth: int, n_cols: int):
+        """
+        Record a deselected row with this many columns; the search goes from depth + 1 to depth.
+        """
+        self._charge(depth)
+        self.uncovers += n_cols
+
+    def backtrack(self):
+        """
+        Record that all rows of a column were tried.
+        """
+        self.backtracks += 1
+
+    def solution(self):
+        """
+        Record a found solution.
+        """
+        self.solutions += 1
+
+    def _charge(self, new_depth: int):
+        # Charge the time since the last event to the current depth
+        now = time.perf_counter()
+        while len(self.depth_time) <= self._depth:
+            self.depth_time.append(0.0)
+        self.depth_time[self._depth] += now - self._last
+        self._depth = new_depth
+        self._last = now
+
+    def to_dict(self) -> Dict:
+        """
+        Return the measurements as a dictionary of plain values.
+        """
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "covers": self.covers,
+            "uncovers": self.uncovers,
+            "max_depth": self.max_depth,
+            "solutions": self.solutions,
+            "total_time": self.total_time(),
+            "depth_time": self.depth_time,
+            "branching": self.branching,
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Return the measurements as JSON.
+
+        :param path: also write the JSON to this file
+        :return: JSON string
+        """
+        data = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(data)
+        return data
+
+
+CHECKPOINT_INTERVAL = 60.0
+"""
+Default number of seconds between two checkpoints of a search.
+"""
+
+
+class Checkpoint:
+    """
+    File that holds the frontier of a search, so an interrupted search can be resumed.
+
+    The frontier of `Matrix.algorithm_x` is the stack of selected rows,
+    together with the untried rows of each level.
+    Rows are stored by label, because the order of rows in a column differs between processes.
+    The frontier of `parallel_algorithm_x` is the list of subproblems and the set of finished subproblems.
+
+    Pass the same checkpoint to the search to save the frontier from time to time, and when the search stops.
+    Pass a checkpoint of an existing file to resume the search where the file left off:
+
+    for solution in matrix.algorithm_x([], checkpoint=Checkpoint("search.checkpoint")):
+        ...
+
+    Resuming yields the solutions that were not yielded before the frontier was saved.
+    Solutions that were yielded after the last save are yielded again.
+    The search saves its frontier when it is closed, exhausted or interrupted by an exception,
+    so only a hard kill loses the work since the last save.
+
+    The file is written atomically: it always holds a complete frontier, even if the process dies while writing.
+    The file is a pickle, so **only load checkpoints that you wrote yourself!**
+    """
+    path: str
+    """
+    Path of the checkpoint file
+    """
+    interval: float
+    """
+    Number of seconds between two periodic saves
+    """
+    state: Optional[Dict]
+    """
+    Last saved frontier, or None if there is none yet
+    """
+
+    def __init__(self, path: str, interval: float = CHECKPOINT_INTERVAL):
+        """
+        :param path: path of the checkpoint file; an existing file is loaded and resumed
+        :param interval: number of seconds between two periodic saves
+        """
+        self.path = path
+        self.interval = interval
+        self.state = None
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                self.state = pickle.load(f)
+        self._next_save = time.monotonic() + interval
+
+    def due(self) -> bool:
+        """
+        Return whether the next periodic save is due.
+        """
+        return time.monotonic() >= self._next_save
+
+    def save(self, state: Dict):
+        """
+        Atomically replace the checkpoint file with the given frontier.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, self.path)
+        self.state = state
+        self._next_save = time.monotonic() + self.interval
+
+
+def _frontier(frames: List[List], forced_rows: List, found: int, explored: bool) -> Dict:
+    # Only the deepest frame can be without a selected row: its rows were not chosen yet, or its row was deselected
+    # Its tried rows are neither in the path nor remaining, and the search resumes by selecting its next row
+    levels = [frame for frame in frames if frame[2] is not None]
+    top = frames[-1] if frames and frames[-1][2] is None else None
+    return {
+        "kind": "search",
+        "forced": list(forced_rows),
+        "path": [frame[0][frame[1] - 1] for frame in levels],
+        "remaining": [frame[0][frame[1]:] for frame in levels],
+        "open": None if top is None else top[0][top[1]:],
+        "explored": explored or top is not None,
+        "solutions": found,
+    }
+
 
 class Matrix(Generic[Row, Col]):
     """
@@ -40,10 +305,30 @@ class Matrix(Generic[Row, Col]):
 
     This is what we use most of the time.
     """
+    buckets: List[Dict[Col, None]]
+    """
+    Maps each size to the columns with this number of rows (bucket queue).
+
+    Each bucket is a dictionary without values, which is an ordered set.
+    Covering and uncovering move columns between buckets, so choosing a column doesn't scan all columns.
+    """
+    min_size: int
+    """
+    Lower bound on the size of the smallest column.
+    """
+    source: Optional[rng.RandomSource]
+    """
+    Source of randomness for breaking ties between columns and for the order of rows.
+
+    None means that the search is deterministic.
+    """
 
     def __init__(self):
         self.rows = defaultdict(list)
         self.cols = defaultdict(set)
+        self.buckets = [{}]
+        self.min_size = 0
+        self.source = None
 
     def __repr__(self) -> str:
         return repr(self.rows)
@@ -66,7 +351,9 @@ class Matrix(Generic[Row, Col]):
         """
         self.rows[row] = cols
         for col in cols:
+            old_size = len(self.cols[col])
             self.cols[col].add(row)
+            self._rebucket(col, old_size)
 
     def add_column(self, col: Col, rows: Set[Row]):
         """
@@ -75,30 +362,65 @@ class Matrix(Generic[Row, Col]):
         :param col: column label
         :param rows: set of labels of rows that are member
         """
+        old_size = len(self.cols[col]) if col in self.cols else None
         self.cols[col] = rows
+        self._rebucket(col, old_size)
         for row in rows:
             bisect.insort(self.rows[row], col)
 
+    def _rebucket(self, col: Col, old_size: Optional[int]):
+        """
+        Move the column into the bucket of its current size.
+
+        :param col: column label
+        :param old_size: size of the column before it changed; None if the column is new
+        """
+        if old_size is not None:
+            self.buckets[old_size].pop(col, None)
+        size = len(self.cols[col])
+        while len(self.buckets) <= size:
+            self.buckets.append({})
+        self.buckets[size][col] = None
+        self.min_size = min(self.min_size, size)
+
     def choose_column(self) -> Col:
         """
         Choose the next column to work on.
 
         This is a deterministic choice, so we return exactly one column.
+        We take a column with the fewest rows from the bucket queue.
+        The scan starts at the lower bound of the smallest size,
+        so it stops right away when a column without rows leads to a dead end.
+
+        With a source of randomness, ties between columns of the same size are broken at random.
 
         :return: next column
         """
-        return min(self.cols, key=lambda i: len(self.cols[i]))
+        buckets = self.buckets
+        size = self.min_size
+        while not buckets[size]:
+            size += 1
+        self.min_size = size
+        bucket = buckets[size]
+        if self.source is None or len(bucket) == 1:
+            return next(iter(bucket))
+        # One buffer for all bucket sizes; the bias of at most len(bucket) / 2^30 doesn't matter for tie-breaking
+        return list(bucket)[self.source.randbelow(1 << 30) % len(bucket)]
 
     def choose_row(self, c: Col) -> Iterator[Row]:
         """
         Choose the next row to work on.
 
         Because this is a nondeterministic choice, we have to iterate over all possible rows.
+        With a source of randomness, the rows come in random order.
 
         :param c: chosen column
         :return: iterator of next rows
         """
-        for r in list(self.cols[c]):
+        rows = list(self.cols[c])
+        if self.source is not None:
+            self.source.shuffle(rows)
+        for r in rows:
             yield r
 
     def cover_column(self, r: Row) -> List[Set[Row]]:
@@ -109,21 +431,38 @@ class Matrix(Generic[Row, Col]):
         :return: list of removed columns
         """
         removed_cols = []
+        rows, cols, buckets = self.rows, self.cols, self.buckets
+        min_size = self.min_size
 
-        # Delete all columns j inside row r (where r[j] == 1)
-        # Because row r already covers them
-        for j in self.rows[r]:
-            # Delete all rows i inside column j (where i[j] == 1)
-            # Because row i would cover the same column as row r
-            # We keep self.rows constant and remove i from self.cols instead
-            for i in self.cols[j]:
-                for col in self.rows[i]:
-                    if col != j:  # Cannot change self.cols[j] while iterating over it
-                        self.cols[col].remove(i)
+        try:
+            # Delete all columns j inside row r (where r[j] == 1)
+            # Because row r already covers them
+            for j in rows[r]:
+                # Delete all rows i inside column j (where i[j] == 1)
+                # Because row i would cover the same column as row r
+                # We keep self.rows constant and remove i from self.cols instead
+                for i in cols[j]:
+                    for col in rows[i]:
+                        if col != j:  # Cannot change self.cols[j] while iterating over it
+                            col_rows = cols[col]
+                            size = len(col_rows) - 1
+                            col_rows.remove(i)
+                            del buckets[size + 1][col]
+                            buckets[size][col] = None
+                            if size < min_size:
+                                min_size = size
 
-            removed_cols.append(self.cols.pop(j))
+                removed = cols[j]
+                removed_cols.append(removed)
+                del cols[j]
+                buckets[len(removed)].pop(j, None)
 
-        return removed_cols
+            self.min_size = min_size
+            return removed_cols
+        except BaseException:
+            # Interrupted halfway (such as by KeyboardInterrupt): leave the matrix as it was
+            self.restore_columns(removed_cols + [cols[j] for j in rows[r] if j in cols])
+            raise
 
     def uncover_column(self, removed_cols: List[Set[Row]]):
         """
@@ -134,19 +473,57 @@ class Matrix(Generic[Row, Col]):
 
         :param removed_cols: list of removed columns
         """
+        rows, cols, buckets = self.rows, self.cols, self.buckets
+
         # Restore each removed column j
         for j in removed_cols:
             # Restore each row i inside column j (where i[j] == 1)
             for i in j:
                 # Add row i to each column, including j
+                for col in rows[i]:
+                    col_rows = cols[col]
+                    size = len(col_rows)
+                    col_rows.add(i)
+                    # Column j is new when its first row is restored
+                    buckets[size].pop(col, None)
+                    buckets[size + 1][col] = None
+
+    def restore_columns(self, removed_cols: List[Set[Row]]):
+        """
+        Put back all rows of the removed columns and rebuild the bucket queue.
+
+        Unlike `uncover_column`, this is safe to repeat,
+        so it finishes (un)covering that was interrupted halfway.
+
+        :param removed_cols: list of removed columns
+        """
+        for j in removed_cols:
+            for i in j:
                 for col in self.rows[i]:
                     self.cols[col].add(i)
 
-    def algorithm_x(self, selected_rows: List[Row] = None) -> Iterator[List[Row]]:
+        for bucket in self.buckets:
+            bucket.clear()
+        for col, col_rows in self.cols.items():
+            self.buckets[len(col_rows)][col] = None
+        self.min_size = 0
+
+    def has_row(self, r: Row) -> bool:
+        """
+        Return whether row r is still in the matrix (not removed by covering).
+        """
+        return all(col in self.cols and r in self.cols[col] for col in self.rows[r])
+
+    def algorithm_x(self, selected_rows: List[Row] = None, forced_rows: List[Row] = (),
+                    node_budget: Optional[int] = None, stats: Optional[SearchStats] = None,
+                    checkpoint: Optional[Checkpoint] = None) -> Iterator[List[Row]]:
         """
         Solve the exact cover problem.
 
         Uses Donald Knuth's Algorithm X.
+        The search is iterative: each level of the search tree is a frame on an explicit stack,
+        so each solution is yielded once instead of through a chain of nested generators,
+        and deep searches (such as large Sudoku boards) don't hit the recursion limit.
 
         https://arxiv.org/pdf/cs/0011047.pdf
 
@@ -155,22 +532,930 @@ class Matrix(Generic[Row, Col]):
 
         https://www.cs.mcgill.ca/~aassaf9/python/algorithm_x.html
 
-        :param selected_rows:
-        :return: iterator over solutions
+        The matrix is restored when the iterator is exhausted or closed,
+        or when the search runs out of its node budget.
+
+        Set `self.source` to randomize the search (see `solve_with_restarts`).
+
+        :param selected_rows: rows that were selected before; they prefix every solution
+        :param forced_rows: rows that every solution must contain; they are covered before the search
+        :param node_budget: raise `BudgetExceeded` after selecting this many rows; None means no limit
+        :param stats: measure the search (see `SearchStats`)
+        :param checkpoint: save the frontier of the search to this checkpoint, and resume from it (see `Checkpoint`)
+        :return: iterator over solutions (each solution is a new list)
+        """
+        prefix = (list(selected_rows) if selected_rows is not None else []) + list(forced_rows)
+        search = self._search(forced_rows, node_budget, stats, checkpoint)
+        try:
+            for selected in search:
+                yield prefix + selected
+        finally:
+            search.close()
+
+    def count_solutions(self, limit: Optional[int] = None, forced_rows: List[Row] = (),
+                        stats: Optional[SearchStats] = None, checkpoint: Optional[Checkpoint] = None) -> int:
+        """
+        Count the solutions of the exact cover problem.
+
+        Works like `algorithm_x`, but builds no solutions.
+        With a limit, the search stops as soon as the limit is reached.
+        A limit of 2 tells whether a solution is unique:
+
+        unique = matrix.count_solutions(2) == 1
+
+        :param limit: stop counting at this number of solutions; None counts all solutions
+        :param forced_rows: rows that every solution must contain; they are covered before the search
+        :param stats: measure the search (see `SearchStats`)
+        :param checkpoint: save the frontier and the count to this checkpoint, and resume from it (see `Checkpoint`)
+        :return: number of solutions (at most limit)
+        """
+        count = 0
+        if checkpoint is not None and checkpoint.state is not None:
+            count = checkpoint.state["solutions"]
+            if limit is not None and count >= limit:
+                # The limit was reached before the checkpoint was saved
+                return limit
+        search = self._search(forced_rows, stats=stats, checkpoint=checkpoint)
+        try:
+            for _ in search:
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            search.close()
+        return count
+
+    def _search(self, forced_rows: List[Row], node_budget: Optional[int] = None,
+                stats: Optional[SearchStats] = None, checkpoint: "Optional[Checkpoint]" = None) -> Iterator[List[Row]]:
+        """
+        Run Algorithm X and yield the list of selected rows at each solution.
+
+        The list is owned by the search; it changes when the search resumes.
+        Each frame on the stack holds the rows of the chosen column, the index of the next untried row,
+        and the columns that were removed by the selected row (None if no row is selected).
+        """
+        forced = []
+        frames = []
+        selected = []
+        nodes = 0
+        found = 0
+        # The subtree below the selected rows was already searched (only when resuming)
+        explored = False
+        # The subtree below the selected rows is done: at a solution or while backtracking
+        at_yield = False
+        backtracking = False
+        finished = False
+        state = checkpoint.state if checkpoint is not None else None
+        # Don't overwrite the checkpoint before the saved frontier is restored
+        resumed = state is None
+        if state is not None and (state["kind"] != "search" or state["forced"] != list(forced_rows)):
+            # Raise before the try block, so the checkpoint is not overwritten
+            raise ValueError("Checkpoint belongs to a different search")
+        try:
+            for r in forced_rows:
+                if not self.has_row(r):
+                    finished = True
+                    return
+                forced.append(self.cover_column(r))
+
+            if state is not None:
+                for r, remaining in zip(state["path"], state["remaining"]):
+                    selected.append(r)
+                    frames.append([[r] + remaining, 1, self.cover_column(r)])
+                if state["open"] is not None:
+                    frames.append([state["open"], 0, None])
+                explored = state["explored"]
+                found = state["solutions"]
+                resumed = True
+            if stats is not None:
+                stats.start()
+
+            while True:
+                if explored:
+                    explored = False
+                elif self.is_empty():
+                    if stats is not None:
+                        stats.solution()
+                    found += 1
+                    at_yield = True
+                    yield selected
+                    at_yield = False
+                else:
+                    c = self.choose_column()
+                    if stats is not None:
+                        stats.choose(len(self.cols[c]))
+                    frames.append([list(self.choose_row(c)), 0, None])
+
+                # Backtrack to the deepest frame with untried rows and select the next row
+                backtracking = True
+                while frames:
+                    frame = frames[-1]
+                    if frame[2] is not None:
+                        try:
+                            self.uncover_column(frame[2])
+                            frame[2] = None
+                        except BaseException:
+                            # Finish uncovering, so the row counts as deselected and is not uncovered twice
+                            self.restore_columns(frame[2])
+                            frame[2] = None
+                            raise
+                        r = selected.pop()
+                        if stats is not None:
+                            stats.deselect(len(selected), len(self.rows[r]))
+                    if frame[1] == len(frame[0]):
+                        frames.pop()
+                        if stats is not None:
+                            stats.backtrack()
+                        continue
+                    if node_budget is not None:
+                        nodes += 1
+                        if nodes > node_budget:
+                            raise BudgetExceeded(f"Selected more than {node_budget} rows")
+                    r = frame[0][frame[1]]
+                    if stats is not None:
+                        stats.select(len(selected), len(self.rows[r]))
+                    backtracking = False
+                    # Covering rolls back if interrupted, so the row is either selected and tried, or neither
+                    frame[1], frame[2] = frame[1] + 1, self.cover_column(r)
+                    selected.append(r)
+                    if checkpoint is not None and checkpoint.due():
+                        checkpoint.save(_frontier(frames, forced_rows, found, False))
+                    break
+                else:
+                    finished = True
+                    return
+        finally:
+            if checkpoint is not None and resumed:
+                # Closed at a solution or interrupted while backtracking: the subtree of the last selected row is done
+                # Interrupted elsewhere: the subtree of the last selected row is searched again
+                subtree_done = explored or at_yield or backtracking or finished
+                checkpoint.save(_frontier(frames, forced_rows, found, subtree_done))
+            if stats is not None:
+                stats.stop()
+            # Restore the matrix even if the caller stops early
+            while frames:
+                removed_cols = frames.pop()[2]
+                if removed_cols is not None:
+                    self.uncover_column(removed_cols)
+            for removed_cols in reversed(forced):
+                self.uncover_column(removed_cols)
+
+    def compile(self, engine: str = "dict") -> "Union[Matrix[Row, Col], DancingLinks[Row, Col], BitsetMatrix[Row, Col]]":
         """
-        if self.is_empty():
-            yield selected_rows
+        Return a solver for the current state of the matrix.
 
-        c = self.choose_column()
-        for r in self.choose_row(c):
-            selected_rows.append(r)
-            removed_cols = self.cover_column(r)
+        Each solver has the same `algorithm_x` and `count_solutions` interface.
+
+        - dict: this matrix itself (dictionaries of sets)
+        - dlx: Dancing Links over flat integer lists (much faster for large instances)
+        - bitset: bitsets of rows and columns as Python integers (fast for small instances)
+
+        :param engine: name of the solver
+        :return: solver
+        """
+        if engine == "dict":
+            return self
+        if engine == "dlx":
+            return DancingLinks.from_matrix(self)
+        if engine == "bitset":
+            return BitsetMatrix.from_matrix(self)
+        raise ValueError(f"Unknown engine: {engine}")
+
+
+class DancingLinks(Generic[Row, Col]):
+    """
+    Instance of the exact cover problem, compiled into Dancing Links.
 
-            for solution in self.algorithm_x(selected_rows):
-                yield solution
+    Rows and columns are numbered, and each 1 in the matrix becomes a node.
+    Each node is linked to its neighbors in the same row (left, right) and in the same column (up, down).
+    Node 0 is the root, nodes 1 to n_cols are the column headers, and the remaining nodes are the cells.
 
-            self.uncover_column(removed_cols)
-            selected_rows.pop()
+    Covering a column unlinks it and all rows that intersect it.
+    The unlinked nodes keep their own links, so uncovering relinks them in reverse order.
+    All links are integers in flat lists, so (un)covering moves no Python objects around.
+    Lists are faster than `array("i")` in CPython, because reading from an array creates a new int object.
+
+    https://arxiv.org/pdf/cs/0011047.pdf
+    """
+    row_labels: List[Row]
+    """
+    Maps each row ID to its label
+    """
+    row_ids: Dict[Row, int]
+    """
+    Maps each row label to its ID
+    """
+    row_nodes: List[int]
+    """
+    Maps each row ID to its first node
+    """
+    col_labels: List[Col]
+    """
+    Maps each column ID to its label; column ID 0 is the root
+    """
+    left: List[int]
+    right: List[int]
+    up: List[int]
+    down: List[int]
+    column: List[int]
+    """
+    Maps each node to its column header
+    """
+    row: List[int]
+    """
+    Maps each node to its row ID (-1 for the root and column headers)
+    """
+    size: List[int]
+    """
+    Maps each column header to the number of rows in the column
+    """
+
+    def __init__(self, rows: Dict[Row, List[Col]], cols: List[Col]):
+        """
+        :param rows: maps each row label to a list of labels of columns where this row is member
+        :param cols: list of all column labels (columns without rows make the instance unsolvable)
+        """
+        n_cols = len(cols)
+        col_ids = {col: i + 1 for i, col in enumerate(cols)}
+        self.row_labels = list(rows)
+        self.row_ids = {label: row_id for row_id, label in enumerate(self.row_labels)}
+        self.row_nodes = []
+        self.col_labels = [None] + list(cols)
+
+        self.left = [n_cols] + list(range(n_cols))
+        self.right = list(range(1, n_cols + 1)) + [0]
+        self.up = list(range(n_cols + 1))
+        self.down = list(range(n_cols + 1))
+        self.column = list(range(n_cols + 1))
+        self.row = [-1] * (n_cols + 1)
+        self.size = [0] * (n_cols + 1)
+
+        for row_id, label in enumerate(self.row_labels):
+            row_cols = rows[label]
+            first = len(self.left)
+            last = first + len(row_cols) - 1
+            self.row_nodes.append(first)
+            for node, col in enumerate(row_cols, start=first):
+                c = col_ids[col]
+                # Append node to the bottom of column c
+                self.up.append(self.up[c])
+                self.down.append(c)
+                self.down[self.up[c]] = node
+                self.up[c] = node
+                # Link node into a circular list with the other nodes of the row
+                self.left.append(node - 1 if node > first else last)
+                self.right.append(node + 1 if node < last else first)
+                self.column.append(c)
+                self.row.append(row_id)
+                self.size[c] += 1
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix[Row, Col]) -> "DancingLinks[Row, Col]":
+        """
+        Compile the current state of the matrix.
+
+        Covered columns and rows of the matrix are left out.
+        """
+        rows = defaultdict(list)
+        for col, col_rows in matrix.cols.items():
+            for row in col_rows:
+                rows[row].append(col)
+        return DancingLinks(rows, list(matrix.cols))
+
+    def is_empty(self) -> bool:
+        """
+        Return whether all columns are covered.
+        """
+        return self.right[0] == 0
+
+    def algorithm_x(self, selected_rows: Optional[List[Row]] = None, forced_rows: List[Row] = (),
+                    stats: Optional[SearchStats] = None) -> Iterator[List[Row]]:
+        """
+        Solve the exact cover problem.
+
+        Uses Donald Knuth's Algorithm X with Dancing Links (DLX).
+        The search is iterative: each level of the search tree is a node on an explicit stack.
+
+        The links are restored when the iterator is exhausted or closed,
+        so the instance can be solved again.
+
+        https://arxiv.org/pdf/cs/0011047.pdf
+
+        :param selected_rows: rows that were selected before compiling; they prefix every solution
+        :param forced_rows: rows that every solution must contain; they are selected before the search
+        :param stats: measure the search (see `SearchStats`)
+        :return: iterator over solutions (each solution is a new list)
+        """
+        prefix = (list(selected_rows) if selected_rows is not None else []) + list(forced_rows)
+        row_ids, labels = self.row, self.row_labels
+        search = self._search(forced_rows, stats)
+        try:
+            for stack in search:
+                yield prefix + [labels[row_ids[r]] for r in stack]
+        finally:
+            # Restore the links right away instead of when the search is garbage collected
+            search.close()
+
+    def count_solutions(self, limit: Optional[int] = None, forced_rows: List[Row] = (),
+                        stats: Optional[SearchStats] = None) -> int:
+        """
+        Count the solutions of the exact cover problem.
+
+        Works like `algorithm_x`, but builds no solutions.
+        With a limit, the search stops as soon as the limit is reached.
+
+        :param limit: stop counting at this number of solutions; None counts all solutions
+        :param forced_rows: rows that every solution must contain; they are selected before the search
+        :param stats: measure the search (see `SearchStats`)
+        :return: number of solutions (at most limit)
+        """
+        count = 0
+        search = self._search(forced_rows, stats)
+        try:
+            for _ in search:
+                count += 1
+                if count == limit:
+                    break
+        finally:
+            search.close()
+        return count
+
+    def _search(self, forced_rows: List[Row], stats: Optional[SearchStats] = None) -> Iterator[List[int]]:
+        """
+        Run Algorithm X and yield the stack of selected nodes at each solution.
+
+        The stack is owned by the search; it changes when the search resumes.
+        """
+        left, right, up, down = self.left, self.right, self.up, self.down
+        column, size = self.column, self.size
+
+        def cover(c: int):
+            right[left[c]] = right[c]
+            left[right[c]] = left[c]
+            i = down[c]
+            while i != c:
+                j = right[i]
+                while j != i:
+                    up[down[j]] = up[j]
+                    down[up[j]] = down[j]
+                    size[column[j]] -= 1
+                    j = right[j]
+                i = down[i]
+
+        def uncover(c: int):
+            i = up[c]
+            while i != c:
+                j = left[i]
+                while j != i:
+                    size[column[j]] += 1
+                    up[down[j]] = j
+                    down[up[j]] = j
+                    j = left[j]
+                i = up[i]
+            right[left[c]] = c
+            left[right[c]] = c
+
+        def select(r: int):
+            # Cover the column of row r, then the other columns of row r
+            cover(column[r])
+            j = right[r]
+            while j != r:
+                cover(column[j])
+                j = right[j]
+
+        def deselect(r: int):
+            j = left[r]
+            while j != r:
+                uncover(column[j])
+                j = left[j]
+            uncover(column[r])
+
+        stack = []
+        forced = []
+        forward = True
+        try:
+            for label in forced_rows:
+                r = self.row_nodes[self.row_ids[label]]
+                # The row is gone if one of its columns is covered
+                j = r
+                while True:
+                    c = column[j]
+                    if right[left[c]] != c:
+                        return
+                    j = right[j]
+                    if j == r:
+                        break
+                forced.append(r)
+                select(r)
+            if stats is not None:
+                row_sizes = [0] * len(self.row_nodes)
+                for row_id in self.row:
+                    if row_id >= 0:
+                        row_sizes[row_id] += 1
+                stats.start()
+
+            while True:
+                if forward:
+                    if right[0] == 0:
+                        if stats is not None:
+                            stats.solution()
+                        yield stack
+                        forward = False
+                        continue
+
+                    # Choose the column with the fewest rows
+                    c = right[0]
+                    best, best_size = c, size[c]
+                    while c != 0 and best_size > 0:
+                        if size[c] < best_size:
+                            best, best_size = c, size[c]
+                        c = right[c]
+                    if stats is not None:
+                        stats.choose(best_size)
+
+                    if best_size == 0:
+                        if stats is not None:
+                            stats.backtrack()
+                        forward = False
+                        continue
+                    r = down[best]
+                    if stats is not None:
+                        stats.select(len(stack), row_sizes[self.row[r]])
+                    stack.append(r)
+                    select(r)
+                else:
+                    if not stack:
+                        return
+                    r = stack.pop()
+                    deselect(r)
+                    if stats is not None:
+                        stats.deselect(len(stack), row_sizes[self.row[r]])
+                    r = down[r]
+                    if r == column[r]:
+                        # All rows of this column were tried
+                        if stats is not None:
+                            stats.backtrack()
+                        continue
+                    if stats is not None:
+                        stats.select(len(stack), row_sizes[self.row[r]])
+                    stack.append(r)
+                    select(r)
+                    forward = True
+        finally:
+            if stats is not None:
+                stats.stop()
+            while stack:
+                deselect(stack.pop())
+            while forced:
+                deselect(forced.pop())
+
+
+class BitsetMatrix(Generic[Row, Col]):
+    """
+    Instance of the exact cover problem, compiled into bitsets.
+
+    Rows and columns are numbered.
+    Each column is a Python integer whose set bits are the rows in this column, and vice versa.
+    The state of the search is a bitset of remaining columns and a bitset of remaining rows.
+    Selecting a row removes its columns and all rows that intersect it, using AND / NOT.
+    Deselecting restores the previous two bitsets, so there is nothing to uncover.
+
+    Bitwise operations on Python integers run in C over whole machine words.
+    This is compact and fast for small instances, such as 9x9 Sudoku boards and the N-queens problem.
+    Choosing a column counts the remaining rows of every remaining column,
+    so larger instances are faster with Dancing Links.
+    """
+    row_labels: List[Row]
+    """
+    Maps each row ID to its label
+    """
+    row_ids: Dict[Row, int]
+    """
+    Maps each row label to its ID
+    """
+    col_labels: List[Col]
+    """
+    Maps each column ID to its label
+    """
+    row_cols: List[int]
+    """
+    Maps each row ID to the bitset of its columns
+    """
+    col_rows: List[int]
+    """
+    Maps each column ID to the bitset of its rows
+    """
+    conflicts: List[int]
+    """
+    Maps each row ID to the bitset of rows that share a column with it (including itself)
+    """
+
+    def __init__(self, rows: Dict[Row, List[Col]], cols: List[Col]):
+        """
+        :param rows: maps each row label to a list of labels of columns where this row is member
+        :param cols: list of all column labels (columns without rows make the instance unsolvable)
+        """
+        col_ids = {col: i for i, col in enumerate(cols)}
+        self.row_labels = list(rows)
+        self.row_ids = {label: row_id for row_id, label in enumerate(self.row_labels)}
+        self.col_labels = list(cols)
+        self.row_cols = [0] * len(self.row_labels)
+        self.col_rows = [0] * len(self.col_labels)
+
+        for row_id, label in enumerate(self.row_labels):
+            for col in rows[label]:
+                c = col_ids[col]
+                self.row_cols[row_id] |= 1 << c
+                self.col_rows[c] |= 1 << row_id
+
+        self.conflicts = []
+        for row_id, label in enumerate(self.row_labels):
+            conflicts = 0
+            for col in rows[label]:
+                conflicts |= self.col_rows[col_ids[col]]
+            self.conflicts.append(conflicts)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix[Row, Col]) -> "BitsetMatrix[Row, Col]":
+        """
+        Compile the current state of the matrix.
+
+        Covered columns and rows of the matrix are left out.
+        """
+        rows = defaultdict(list)
+        for col, col_rows in matrix.cols.items():
+            for row in col_rows:
+                rows[row].append(col)
+        return BitsetMatrix(rows, list(matrix.cols))
+
+    def choose_column(self, cols: int, rows: int) -> int:
+        """
+        Choose the remaining column with the fewest remaining rows.
+
+        :param cols: bitset of remaining columns
+        :param rows: bitset of remaining rows
+        :return: bitset of remaining rows in the chosen column
+        """
+        col_rows = self.col_rows
+        best, best_size = 0, len(self.row_labels) + 1
+        while cols:
+            low = cols & -cols
+            cols ^= low
+            candidates = col_rows[low.bit_length() - 1] & rows
+            size = candidates.bit_count()
+            if size < best_size:
+                best, best_size = candidates, size
+                # No column can do better than a dead end or a forced row
+                if size <= 1:
+                    break
+        return best
+
+    def algorithm_x(self, selected_rows: Optional[List[Row]] = None, forced_rows: List[Row] = (),
+                    stats: Optional[SearchStats] = None) -> Iterator[List[Row]]:
+        """
+        Solve the exact cover problem.
+
+        Uses Donald Knuth's Algorithm X over bitsets.
+        The search is iterative: each level of the search tree is a frame on an explicit stack.
+        A frame holds the bitsets before the selection, the untried rows and the selected row.
+
+        :param selected_rows: rows that were selected before compiling; they prefix every solution
+        :param forced_rows: rows that every solution must contain; they are selected before the search
+        :param stats: measure the search (see `SearchStats`)
+        :return: iterator over solutions (each solution is a new list)
+        """
+        prefix = (list(selected_rows) if selected_rows is not None else []) + list(forced_rows)
+        labels = self.row_labels
+        search = self._search(forced_rows, stats)
+        try:
+            for frames in search:
+                yield prefix + [labels[frame[3]] for frame in frames]
+        finally:
+            search.close()
+
+    def count_solutions(self, limit: Optional[int] = None, forced_rows: List[Row] = (),
+                        stats: Optional[SearchStats] = None) -> int:
+        """
+        Count the solutions of the exact cover problem.
+
+        Works like `algorithm_x`, but builds no solutions.
+        With a limit, the search stops as soon as the limit is reached.
+
+        :param limit: stop counting at this number of solutions; None counts all solutions
+        :param forced_rows: rows that every solution must contain; they are selected before the search
+        :param stats: measure the search (see `SearchStats`)
+        :return: number of solutions (at most limit)
+        """
+        count = 0
+        search = self._search(forced_rows, stats)
+        try:
+            for _ in search:
+                count += 1
+                if count == limit:
+                    break
+        finally:
+            search.close()
+        return count
+
+    def _search(self, forced_rows: List[Row], stats: Optional[SearchStats] = None) -> Iterator[List[List[int]]]:
+        """
+        Run Algorithm X and yield the stack of frames at each solution.
+
+        The stack is owned by the search; it changes when the search resumes.
+        """
+        row_cols, conflicts = self.row_cols, self.conflicts
+        cols = (1 << len(self.col_labels)) - 1
+        rows = (1 << len(self.row_labels)) - 1
+        frames = []
+
+        for label in forced_rows:
+            r = self.row_ids[label]
+            if not (rows >> r) & 1:
+                return
+            cols &= ~row_cols[r]
+            rows &= ~conflicts[r]
+
+        if stats is not None:
+            stats.start()
+        try:
+            while True:
+                if cols == 0:
+                    if stats is not None:
+                        stats.solution()
+                    yield frames
+                else:
+                    candidates = self.choose_column(cols, rows)
+                    if stats is not None:
+                        stats.choose(candidates.bit_count())
+                    frames.append([cols, rows, candidates, -1])
+
+                # Backtrack to the deepest frame with untried rows
+                while frames and frames[-1][2] == 0:
+                    frame = frames.pop()
+                    if stats is not None:
+                        if frame[3] >= 0:
+                            stats.deselect(len(frames), row_cols[frame[3]].bit_count())
+                        stats.backtrack()
+                if not frames:
+                    return
+
+                frame = frames[-1]
+                if stats is not None:
+                    if frame[3] >= 0:
+                        stats.deselect(len(frames) - 1, row_cols[frame[3]].bit_count())
+                low = frame[2] & -frame[2]
+                frame[2] ^= low
+                r = low.bit_length() - 1
+                if stats is not None:
+                    stats.select(len(frames) - 1, row_cols[r].bit_count())
+                frame[3] = r
+                cols = frame[0] & ~row_cols[r]
+                rows = frame[1] & ~conflicts[r]
+        finally:
+            if stats is not None:
+                stats.stop()
+
+
+TASKS_PER_WORKER = 8
+"""
+Number of subproblems per worker when the search tree is split automatically.
+
+More subproblems than workers balance the load: workers that finish early take the next subproblem.
+"""
+
+_solver = None
+"""
+Compiled solver of the worker process
+"""
+
+
+def split_search(matrix: Matrix[Row, Col], depth: Optional[int] = None, min_tasks: int = 1) -> List[List[Row]]:
+    """
+    Split the search tree of the matrix into independent subproblems.
+
+    The top levels of the search tree are expanded the same way as `Matrix.algorithm_x` does.
+    Each subproblem is a prefix of selected rows. Dead ends are left out.
+    Together, the subproblems contain all solutions, and no solution is in two subproblems.
+
+    :param matrix: exact cover instance (restored before returning)
+    :param depth: number of levels to expand; None expands until there are at least min_tasks subproblems
+    :param min_tasks: least number of subproblems if depth is None
+    :return: list of prefixes
+    """
+    prefixes = [[]]
+    level = 0
+    while (level < depth) if depth is not None else (len(prefixes) < min_tasks):
+        expanded = []
+        for prefix in prefixes:
+            removed = [matrix.cover_column(r) for r in prefix]
+            if matrix.is_empty():
+                # Solution above the split level
+                expanded.append(prefix)
+            else:
+                c = matrix.choose_column()
+                expanded.extend(prefix + [r] for r in matrix.choose_row(c))
+            for cols in reversed(removed):
+                matrix.uncover_column(cols)
+
+        if expanded == prefixes or not expanded:
+            prefixes = expanded
+            break
+        prefixes = expanded
+        level += 1
+
+    return prefixes
+
+
+def _init_solver(matrix: Matrix, engine: str):
+    global _solver
+    _solver = matrix.compile(engine)
+
+
+def _solve_prefix(task: Tuple[List, bool]) -> List[List]:
+    prefix, first = task
+    solutions = []
+    for solution in _solver.algorithm_x([], forced_rows=prefix):
+        solutions.append(list(solution))
+        if first:
+            break
+    return solutions
+
+
+def _solve_task(task: Tuple[int, List, bool]) -> Tuple[int, List[List]]:
+    index, prefix, first = task
+    return index, _solve_prefix((prefix, first))
+
+
+def parallel_algorithm_x(matrix: Matrix[Row, Col], workers: Optional[int] = None, depth: Optional[int] = None,
+                         engine: str = "dlx", first: bool = False,
+                         checkpoint: Optional[Checkpoint] = None) -> Iterator[List[Row]]:
+    """
+    Solve the exact cover problem on several processes.
+
+    The search tree is split into subproblems (see `split_search`), which are solved by a pool of worker processes.
+    Each worker compiles the matrix once and solves each subproblem by forcing the rows of its prefix.
+    Workers take the next subproblem as soon as they are done, so the load stays balanced.
+    Solutions are yielded as soon as their subproblem is solved, in no particular order.
+
+    Closing the iterator cancels the remaining subproblems.
+    For a single solution, use first=True, so each worker stops after the first solution of its subproblem:
+
+    solution = next(parallel_algorithm_x(matrix, first=True))
+
+    With a checkpoint, the subproblems and the finished subproblems are saved after each finished subproblem,
+    and when the iterator is closed or interrupted.
+    Resuming skips the finished subproblems (see `Checkpoint`).
+    The solutions that were already yielded from a subproblem that was not finished are saved as well,
+    so resuming skips them when the subproblem is solved again.
+
+    :param matrix: exact cover instance
+    :param workers: number of worker processes; defaults to the number of CPUs; 1 means no pool
+    :param depth: number of levels to split; None splits into several subproblems per worker
+    :param engine: solver for each subproblem (see `Matrix.compile`)
+    :param first: find at most one solution per subproblem
+    :param checkpoint: save the finished subproblems to this checkpoint, and resume from it
+    :return: iterator over solutions
+    """
+    n_workers = workers or multiprocessing.cpu_count()
+    if checkpoint is not None and checkpoint.state is not None:
+        if checkpoint.state["kind"] != "parallel":
+            raise ValueError("Checkpoint belongs to a different search")
+        # The split depends on the order of rows, which differs between processes
+        prefixes = checkpoint.state["prefixes"]
+        done = set(checkpoint.state["done"])
+        yielded = checkpoint.state["yielded"]
+    else:
+        prefixes = split_search(matrix, depth, TASKS_PER_WORKER * n_workers)
+        done = set()
+        yielded = {}
+    tasks = [(index, prefix, first) for index, prefix in enumerate(prefixes) if index not in done]
+
+    def save():
+        if checkpoint is not None:
+            checkpoint.save({"kind": "parallel", "prefixes": prefixes, "done": sorted(done), "yielded": yielded})
+
+    save()
+    if workers == 1:
+        _init_solver(matrix, engine)
+        results = map(_solve_task, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(n_workers, initializer=_init_solver, initargs=(matrix, engine))
+        results = pool.imap_unordered(_solve_task, tasks)
+
+    try:
+        for index, solutions in results:
+            # The order of solutions differs between processes, so compare them as sets of rows
+            skip = {frozenset(solution) for solution in yielded.get(index, [])}
+            for solution in solutions:
+                if frozenset(solution) not in skip:
+                    yielded.setdefault(index, []).append(solution)
+                    yield solution
+            done.add(index)
+            yielded.pop(index, None)
+            save()
+    finally:
+        if pool is not None:
+            pool.terminate()
+        save()
+
+
+RESTART_GROWTH = 1.5
+"""
+Factor by which the node budget grows after each restart of the geometric schedule.
+"""
+
+
+def luby(i: int) -> int:
+    """
+    Return the i-th term of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+
+    Restarting with these budgets (times a unit) is within a logarithmic factor of the optimal schedule
+    for any distribution of run times.
+
+    https://doi.org/10.1016/0020-0190(93)90029-9
+
+    :param i: index starting at 1
+    :return: term of the sequence
+    """
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+def node_budgets(schedule: str, unit: int) -> Iterator[int]:
+    """
+    Return the node budget of each run of a restart schedule.
+
+    - luby: unit times the Luby sequence
+    - geometric: unit times powers of RESTART_GROWTH
+
+    :param schedule: name of the schedule
+    :param unit: budget of the first run
+    :return: infinite iterator of budgets
+    """
+    if schedule == "luby":
+        return (unit * luby(i) for i in itertools.count(1))
+    if schedule == "geometric":
+        return (math.ceil(unit * RESTART_GROWTH ** i) for i in itertools.count())
+    raise ValueError(f"Unknown schedule: {schedule}")
+
+
+def _restarts(matrix: Matrix[Row, Col], schedule: str, unit: Optional[int], source: rng.RandomSource) -> Optional[List[Row]]:
+    if unit is None:
+        # Each selected row covers at least one column, so a search without backtracking fits into this budget
+        unit = max(1, len(matrix.cols))
+    previous = matrix.source
+    matrix.source = source
+    try:
+        for budget in node_budgets(schedule, unit):
+            try:
+                return next(matrix.algorithm_x([], node_budget=budget), None)
+            except BudgetExceeded:
+                pass
+    finally:
+        matrix.source = previous
+
+
+def _race(task: Tuple[str, Optional[int], rng.RandomSource]) -> Optional[List]:
+    schedule, unit, source = task
+    return _restarts(_solver, schedule, unit, source)
+
+
+def solve_with_restarts(matrix: Matrix[Row, Col], schedule: str = "luby", unit: Optional[int] = None,
+                        seed: rng.Seed = None, workers: int = 1) -> Optional[List[Row]]:
+    """
+    Find one solution of the exact cover problem using randomized restarts.
+
+    The run time of backtracking is heavy-tailed:
+    An unlucky choice near the root of the search tree can lead into a huge subtree without solutions,
+    while other choices find a solution right away.
+    This function randomizes the choice of columns (among the smallest) and the order of rows,
+    and restarts the search with a fresh random choice whenever it runs out of its node budget.
+    The budgets grow with each restart, so the search eventually runs to completion.
+
+    With more than one worker, several randomized searches race each other on separate processes,
+    and the first result wins.
+
+    :param matrix: exact cover instance (restored before returning)
+    :param schedule: restart schedule (see `node_budgets`)
+    :param unit: budget of the first run; defaults to the number of columns
+    :param seed: seed of the randomness; None for fresh entropy
+    :param workers: number of racing processes; 1 means no pool
+    :return: solution, or None if there is no solution
+    """
+    source = rng.RandomSource(seed)
+    if workers == 1:
+        return _restarts(matrix, schedule, unit, source)
+
+    tasks = [(schedule, unit, child) for child in source.spawn(workers)]
+    pool = multiprocessing.Pool(workers, initializer=_init_solver, initargs=(matrix, "dict"))
+    try:
+        return next(pool.imap_unordered(_race, tasks))
+    finally:
+        pool.terminate()
 
 
 class TestMatrix(unittest.TestCase):
@@ -214,3 +1499,370 @@ class TestMatrix(unittest.TestCase):
         matrix = self.get_matrix()
         solution = next(matrix.algorithm_x([]))
         self.assertEqual(["B", "D", "F"], solution)
+
+    def test_restore_matrix(self):
+        matrix = self.get_matrix()
+        next(matrix.algorithm_x([]))  # Stop early
+        self.assertEqual(self.get_matrix(), matrix)
+        self.assertEqual([["B", "D", "F"]], [sorted(solution) for solution in matrix.algorithm_x([])])
+        self.assertEqual(self.get_matrix(), matrix)
+
+    def test_deep_search(self):
+        # Each row covers its own column, so the search tree is as deep as the matrix is wide
+        matrix = Matrix()
+        for i in range(2000):
+            matrix.add_row(i, [i])
+        self.assertEqual(list(range(2000)), sorted(next(matrix.algorithm_x([]))))
+        self.assertEqual(1, matrix.count_solutions())
+
+
+class TestSearchStats(unittest.TestCase):
+    def test_small_matrix(self):
+        matrix = TestMatrix.get_matrix(self)
+        for engine in ("dict", "dlx", "bitset"):
+            stats = SearchStats()
+            self.assertEqual(1, matrix.compile(engine).count_solutions(stats=stats))
+            # A column with two rows, then a dead end on one branch and two forced rows on the other
+            self.assertEqual([1, 2, 1], stats.branching)
+            self.assertEqual(4, stats.nodes)
+            self.assertEqual(4, stats.backtracks)
+            self.assertEqual(3, stats.max_depth)
+            self.assertEqual(1, stats.solutions)
+            self.assertEqual(stats.covers, stats.uncovers)
+
+    def test_queens(self):
+        matrix = queens_matrix(6)
+        for engine in ("dict", "dlx", "bitset"):
+            stats = SearchStats()
+            self.assertEqual(4, len(list(matrix.compile(engine).algorithm_x([], stats=stats))))
+            self.assertEqual(4, stats.solutions)
+            self.assertEqual(stats.covers, stats.uncovers)
+            # Each chosen column is left once all its rows were tried
+            self.assertEqual(sum(stats.branching), stats.backtracks)
+            self.assertEqual(sum(size * count for size, count in enumerate(stats.branching)), stats.nodes)
+            self.assertTrue(stats.max_depth >= 6)
+            self.assertEqual(stats.max_depth + 1, len(stats.depth_time))
+            self.assertTrue(stats.total_time() > 0)
+
+    def test_to_json(self):
+        stats = SearchStats()
+        next(queens_matrix(8).algorithm_x([], stats=stats))
+        data = json.loads(stats.to_json())
+        self.assertEqual(stats.nodes, data["nodes"])
+        self.assertEqual(1, data["solutions"])
+        self.assertEqual(stats.branching, data["branching"])
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "search.checkpoint")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resume(self):
+        matrix = queens_matrix(6)
+        expected = sorted(sorted(solution) for solution in matrix.algorithm_x([]))
+        search = matrix.algorithm_x([], checkpoint=Checkpoint(self.path))
+        before = [next(search), next(search)]
+        search.close()
+        self.assertEqual(queens_matrix(6), matrix)
+
+        after = list(matrix.algorithm_x([], checkpoint=Checkpoint(self.path)))
+        self.assertEqual(expected, sorted(sorted(solution) for solution in before + after))
+        self.assertEqual([], list(matrix.algorithm_x([], checkpoint=Checkpoint(self.path))))
+
+    def test_periodic(self):
+        matrix = queens_matrix(6)
+        copy = os.path.join(self.directory.name, "copy.checkpoint")
+        # Save at every node
+        search = matrix.algorithm_x([], checkpoint=Checkpoint(self.path, interval=0))
+        next(search)
+        next(search)
+        # Simulate a hard kill after the second solution
+        os.replace(self.path, copy)
+        search.close()
+
+        checkpoint = Checkpoint(copy)
+        # The frontier was saved before the second solution was yielded
+        self.assertEqual(1, checkpoint.state["solutions"])
+        self.assertEqual(3, len(list(matrix.algorithm_x([], checkpoint=checkpoint))))
+
+    def test_interrupted(self):
+        matrix = queens_matrix(8)
+        before = []
+        with self.assertRaises(BudgetExceeded):
+            for solution in matrix.algorithm_x([], node_budget=2000, checkpoint=Checkpoint(self.path)):
+                before.append(tuple(sorted(solution)))
+        after = [tuple(sorted(solution)) for solution in matrix.algorithm_x([], checkpoint=Checkpoint(self.path))]
+        self.assertEqual(92, len(before + after))
+        self.assertEqual(92, len(set(before + after)))
+        self.assertTrue(len(after) < 92)
+
+    def test_keyboard_interrupt(self):
+        class Interrupt(SearchStats):
+            def __init__(self, hook: str, n: int):
+                super().__init__()
+                self.calls = 0
+                setattr(self, hook, self.interrupt)
+                self.n = n
+
+            def interrupt(self, *args):
+                self.calls += 1
+                if self.calls == self.n:
+                    raise KeyboardInterrupt
+
+        matrix = queens_matrix(8)
+        for hook in ("select", "deselect", "backtrack", "choose"):
+            for n in range(1, 2000, 199):
+                path = os.path.join(self.directory.name, f"{hook}{n}.checkpoint")
+                with self.assertRaises(KeyboardInterrupt):
+                    matrix.count_solutions(stats=Interrupt(hook, n), checkpoint=Checkpoint(path))
+                self.assertEqual(queens_matrix(8), matrix)
+                self.assertEqual(92, matrix.count_solutions(checkpoint=Checkpoint(path)))
+
+    def test_interrupted_cover(self):
+        matrix = queens_matrix(6)
+        row = ("queen", 2, 3)
+        lines = 0
+        while True:
+            lines += 1
+            calls = 0
+
+            def trace(frame, event, arg):
+                nonlocal calls
+                if event == "line":
+                    calls += 1
+                    if calls == lines:
+                        raise KeyboardInterrupt
+                return trace
+
+            sys.settrace(lambda frame, event, arg: trace if frame.f_code is Matrix.cover_column.__code__ else None)
+            try:
+                removed_cols = matrix.cover_column(row)
+            except KeyboardInterrupt:
+                sys.settrace(None)
+                # Interrupted halfway: the matrix is restored
+                self.assertEqual(queens_matrix(6), matrix)
+                continue
+            finally:
+                sys.settrace(None)
+            matrix.uncover_column(removed_cols)
+            break
+        self.assertTrue(lines > 10)
+        self.assertEqual(4, matrix.count_solutions())
+
+    def test_count_solutions(self):
+        matrix = queens_matrix(6)
+        self.assertEqual(1, matrix.count_solutions(1, checkpoint=Checkpoint(self.path)))
+        self.assertEqual(4, matrix.count_solutions(checkpoint=Checkpoint(self.path)))
+        with self.assertRaises(ValueError):
+            next(matrix.algorithm_x([], forced_rows=[("queen", 0, 1)], checkpoint=Checkpoint(self.path)))
+        self.assertEqual(4, matrix.count_solutions(checkpoint=Checkpoint(self.path)))
+
+    def test_count_solutions_limit(self):
+        matrix = queens_matrix(6)
+        self.assertEqual(2, matrix.count_solutions(2, checkpoint=Checkpoint(self.path)))
+        # The saved count already reached the limit
+        self.assertEqual(2, matrix.count_solutions(2, checkpoint=Checkpoint(self.path)))
+        self.assertEqual(1, matrix.count_solutions(1, checkpoint=Checkpoint(self.path)))
+        self.assertEqual(3, matrix.count_solutions(3, checkpoint=Checkpoint(self.path)))
+        self.assertEqual(4, matrix.count_solutions(checkpoint=Checkpoint(self.path)))
+
+        other = os.path.join(self.directory.name, "other.checkpoint")
+        next(matrix.algorithm_x([], checkpoint=Checkpoint(other)))
+        self.assertEqual(1, matrix.count_solutions(1, checkpoint=Checkpoint(other)))
+        self.assertEqual(2, matrix.count_solutions(2, checkpoint=Checkpoint(other)))
+
+    def test_parallel(self):
+        matrix = queens_matrix(8)
+        search = parallel_algorithm_x(matrix, workers=1, checkpoint=Checkpoint(self.path))
+        before = [tuple(sorted(next(search))) for _ in range(30)]
+        search.close()
+        done = Checkpoint(self.path).state["done"]
+        self.assertTrue(len(done) > 0)
+
+        for workers in (1, 2):
+            copy = os.path.join(self.directory.name, f"copy{workers}.checkpoint")
+            with open(self.path, "rb") as f, open(copy, "wb") as g:
+                g.write(f.read())
+            after = [tuple(sorted(solution)) for solution in parallel_algorithm_x(matrix, workers, checkpoint=Checkpoint(copy))]
+            self.assertEqual(92, len(before + after))
+            self.assertEqual(92, len(set(before + after)))
+            self.assertTrue(len(after) < 92)
+            self.assertEqual([], list(parallel_algorithm_x(matrix, workers, checkpoint=Checkpoint(copy))))
+
+
+class TestRestarts(unittest.TestCase):
+    def test_luby(self):
+        self.assertEqual([1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8], [luby(i) for i in range(1, 16)])
+        self.assertEqual([10, 15, 23], list(itertools.islice(node_budgets("geometric", 10), 3)))
+
+    def test_randomized(self):
+        matrix = queens_matrix(6)
+        expected = sorted(sorted(solution) for solution in matrix.algorithm_x([]))
+        matrix.source = rng.RandomSource(0)
+        solutions = list(matrix.algorithm_x([]))
+        matrix.source = None
+        self.assertEqual(expected, sorted(sorted(solution) for solution in solutions))
+        self.assertEqual(queens_matrix(6), matrix)
+
+    def test_node_budget(self):
+        matrix = queens_matrix(8)
+        with self.assertRaises(BudgetExceeded):
+            list(matrix.algorithm_x([], node_budget=10))
+        self.assertEqual(queens_matrix(8), matrix)
+
+    def test_solve_with_restarts(self):
+        matrix = queens_matrix(12)
+        for schedule in ("luby", "geometric"):
+            solution = solve_with_restarts(matrix, schedule, unit=5, seed=1)
+            self.assertEqual(12, len([row for row in solution if row[0] == "queen"]))
+            self.assertEqual(queens_matrix(12), matrix)
+            self.assertIsNone(matrix.source)
+
+        unsolvable = TestMatrix.get_matrix(self)
+        unsolvable.add_column(8, set())
+        self.assertIsNone(solve_with_restarts(unsolvable, unit=1))
+
+    def test_race(self):
+        solution = solve_with_restarts(queens_matrix(10), seed=0, workers=2)
+        self.assertEqual(10, len([row for row in solution if row[0] == "queen"]))
+
+
+class TestDancingLinks(unittest.TestCase):
+    get_matrix = TestMatrix.get_matrix
+
+    def test_algorithm_x(self):
+        dlx = self.get_matrix().compile("dlx")
+        self.assertEqual([["B", "D", "F"]], [sorted(solution) for solution in dlx.algorithm_x()])
+        solution = next(dlx.algorithm_x(["X"]))
+        self.assertEqual("X", solution[0])
+        self.assertEqual(["B", "D", "F"], sorted(solution[1:]))
+
+    def test_restore_links(self):
+        dlx = self.get_matrix().compile("dlx")
+        links = [dlx.left.copy(), dlx.right.copy(), dlx.up.copy(), dlx.down.copy(), dlx.size.copy()]
+        next(dlx.algorithm_x())  # Stop early
+        self.assertEqual(links, [dlx.left, dlx.right, dlx.up, dlx.down, dlx.size])
+
+    def test_reduced_matrix(self):
+        matrix = self.get_matrix()
+        matrix.cover_column("B")
+        self.assertEqual([["D", "F"]], [sorted(solution) for solution in matrix.compile("dlx").algorithm_x()])
+
+    def test_all_solutions(self):
+        # Each of the rows covers columns 0 and 1, or each column on its own
+        matrix = Matrix()
+        matrix.add_row("01", [0, 1])
+        matrix.add_row("0", [0])
+        matrix.add_row("1", [1])
+        matrix.add_row("2", [2])
+        matrix.add_row("12", [1, 2])
+        solutions = sorted(sorted(solution) for solution in matrix.compile("dlx").algorithm_x())
+        self.assertEqual([["0", "1", "2"], ["0", "12"], ["01", "2"]], solutions)
+
+    def test_unsolvable(self):
+        matrix = self.get_matrix()
+        matrix.add_column(8, set())
+        self.assertEqual([], list(matrix.compile("dlx").algorithm_x()))
+
+    def test_count_solutions(self):
+        matrix = Matrix()
+        matrix.add_row("01", [0, 1])
+        matrix.add_row("0", [0])
+        matrix.add_row("1", [1])
+        matrix.add_row("2", [2])
+        matrix.add_row("12", [1, 2])
+        for engine in ("dict", "dlx", "bitset"):
+            solver = matrix.compile(engine)
+            self.assertEqual(3, solver.count_solutions())
+            self.assertEqual(2, solver.count_solutions(2))
+            self.assertEqual(1, solver.count_solutions(forced_rows=["12"]))
+            self.assertEqual(0, solver.count_solutions(forced_rows=["01", "1"]))
+            self.assertEqual(3, len(list(solver.algorithm_x([]))))
+        self.assertEqual(92, queens_matrix(8).compile("dlx").count_solutions())
+
+    def test_forced_rows(self):
+        for engine in ("dict", "dlx", "bitset"):
+            solver = self.get_matrix().compile(engine)
+            self.assertEqual(["B", "D", "F"], sorted(next(solver.algorithm_x([], forced_rows=["D"]))))
+            self.assertEqual([], list(solver.algorithm_x([], forced_rows=["A"])))
+            self.assertEqual([], list(solver.algorithm_x([], forced_rows=["B", "C"])))
+            self.assertEqual(["B", "D", "F"], sorted(next(solver.algorithm_x())))
+
+
+class TestBitsetMatrix(unittest.TestCase):
+    get_matrix = TestMatrix.get_matrix
+
+    def test_algorithm_x(self):
+        bitset = self.get_matrix().compile("bitset")
+        self.assertEqual([["B", "D", "F"]], [sorted(solution) for solution in bitset.algorithm_x()])
+        self.assertEqual(["B", "D", "F"], sorted(next(bitset.algorithm_x())))
+
+    def test_reduced_matrix(self):
+        matrix = self.get_matrix()
+        matrix.cover_column("B")
+        self.assertEqual([["D", "F"]], [sorted(solution) for solution in matrix.compile("bitset").algorithm_x()])
+
+    def test_same_solutions(self):
+        matrix = Matrix()
+        matrix.add_row("01", [0, 1])
+        matrix.add_row("0", [0])
+        matrix.add_row("1", [1])
+        matrix.add_row("2", [2])
+        matrix.add_row("12", [1, 2])
+        expected = sorted(sorted(solution) for solution in matrix.compile("dlx").algorithm_x())
+        self.assertEqual(expected, sorted(sorted(solution) for solution in matrix.compile("bitset").algorithm_x()))
+
+    def test_unsolvable(self):
+        matrix = self.get_matrix()
+        matrix.add_column(8, set())
+        self.assertEqual([], list(matrix.compile("bitset").algorithm_x()))
+
+
+def queens_matrix(n: int) -> Matrix[Tuple, str]:
+    """
+    Return the N-queens problem as an instance of the exact cover problem.
+
+    Each queen covers a rank, a file and two diagonals.
+    Each rank and each file has exactly one queen, but diagonals have at most one queen.
+    Each diagonal gets a slack row that covers only this diagonal,
+    so every solution of the N-queens problem corresponds to exactly one exact cover.
+    """
+    matrix = Matrix()
+    for rank in range(n):
+        for file in range(n):
+            matrix.add_row(("queen", rank, file), [f"r{rank}", f"f{file}", f"a{rank + file}", f"b{rank - file}"])
+    for diagonal in range(2 * n - 1):
+        matrix.add_row(("slack", f"a{diagonal}"), [f"a{diagonal}"])
+        matrix.add_row(("slack", f"b{diagonal - n + 1}"), [f"b{diagonal - n + 1}"])
+    return matrix
+
+
+class TestParallel(unittest.TestCase):
+    def test_split_search(self):
+        matrix = queens_matrix(6)
+        expected = sorted(sorted(solution) for solution in matrix.compile("dlx").algorithm_x())
+        for depth in (0, 1, 3):
+            solutions = []
+            prefixes = split_search(matrix, depth)
+            self.assertTrue(all(len(prefix) <= depth for prefix in prefixes))
+            _init_solver(matrix, "dlx")
+            for prefix in prefixes:
+                solutions.extend(_solve_prefix((prefix, False)))
+            self.assertEqual(expected, sorted(sorted(solution) for solution in solutions))
+        self.assertEqual(queens_matrix(6), matrix)
+
+    def test_parallel_algorithm_x(self):
+        matrix = queens_matrix(8)
+        for workers in (1, 2):
+            solutions = list(parallel_algorithm_x(matrix, workers=workers))
+            self.assertEqual(92, len(solutions))
+            self.assertEqual(92, len({tuple(sorted(solution)) for solution in solutions}))
+
+    def test_first_solution(self):
+        matrix = TestMatrix.get_matrix(self)
+        solution = next(parallel_algorithm_x(matrix, workers=2, first=True))
+        self.assertEqual(["B", "D", "F"], sorted(solution))
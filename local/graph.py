@@ -1,9 +1,11 @@
-import random
-import networkx as nx
+from local import rng
+from local.lazy import LazyModule
 from typing import Dict, List, Tuple, TypeVar, Generic, Iterator
 
+nx = LazyModule("networkx")
 
-def random_graph(n: int, e: int) -> nx.Graph:
+
+def random_graph(n: int, e: int) -> "nx.Graph":
     """
     Return a random graph with [n] nodes and [e] edges.
     """
@@ -15,7 +17,7 @@ def random_graph(n: int, e: int) -> nx.Graph:
     return nx.gnm_random_graph(n, e)
 
 
-def non_isomorphic_graph(first: nx.Graph) -> nx.Graph:
+def non_isomorphic_graph(first: "nx.Graph") -> "nx.Graph":
     """
     Return a random graph that is not isomorphic to the [first] graph.
 
@@ -32,7 +34,7 @@ def non_isomorphic_graph(first: nx.Graph) -> nx.Graph:
             return second
 
 
-def three_colorable_graph(n: int) -> Tuple[nx.Graph, Dict[int, int]]:
+def three_colorable_graph(n: int) -> "Tuple[nx.Graph, Dict[int, int]]":
     """
     Return a random graph with at least [n] nodes that is three-colorable.
     Also return the coloring
@@ -44,7 +46,7 @@ def three_colorable_graph(n: int) -> Tuple[nx.Graph, Dict[int, int]]:
     return graph, coloring
 
 
-def not_three_colorable_graph(n: int) -> Tuple[nx.Graph, Dict[int, int]]:
+def not_three_colorable_graph(n: int) -> "Tuple[nx.Graph, Dict[int, int]]":
     """
     Return a random graph with at least [n] nodes that is not three-colorable.
     Also return a fake coloring.
@@ -97,7 +99,7 @@ class Mapping(Generic[A, B]):
         return len(self.inner)
 
     @classmethod
-    def shuffle_graph(cls, graph: nx.Graph) -> "Mapping[int, int]":
+    def shuffle_graph(cls, graph: "nx.Graph") -> "Mapping[int, int]":
         """
         Create a mapping of node labels by random shuffling nodes.
 
@@ -106,7 +108,7 @@ class Mapping(Generic[A, B]):
         """
         original = list(graph.nodes())
         shuffled = original.copy()
-        random.shuffle(shuffled)
+        rng.shuffle(shuffled)
         inner = {original[i]: shuffled[i] for i in range(len(original))}
 
         return Mapping(inner)
@@ -122,12 +124,12 @@ class Mapping(Generic[A, B]):
         :return: random shuffling of list elements
         """
         shuffled = lst.copy()
-        random.shuffle(shuffled)
+        rng.shuffle(shuffled)
         inner = {lst[i]: shuffled[i] for i in range(len(lst))}
 
         return Mapping(inner)
 
-    def apply_graph(self, graph: nx.Graph) -> nx.Graph:
+    def apply_graph(self, graph: "nx.Graph") -> "nx.Graph":
         """
         Apply the mapping of node labels to a graph.
 
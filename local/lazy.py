@@ -0,0 +1,56 @@
+from types import ModuleType
+import importlib
+import sys
+import unittest
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Heavy dependencies such as NumPy or NetworkX take a long time to import.
+    Modules that only need them in some functions can bind a lazy module instead:
+
+    np = LazyModule("numpy")
+
+    The real module is imported the first time that one of its attributes is accessed.
+    Afterwards, the attributes of the real module are copied into the stand-in,
+    so later accesses are as fast as for the real module.
+
+    **Attributes that are only evaluated at definition time (such as type annotations) trigger the import!**
+    Write these annotations as strings.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+
+    def __getattr__(self, attr: str):
+        module = self._load()
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        loaded = "loaded" if self._name in sys.modules else "not loaded"
+        return f"<lazy module '{self._name}' ({loaded})>"
+
+    def _load(self) -> ModuleType:
+        """
+        Import the real module and copy its attributes into the stand-in.
+        """
+        module = importlib.import_module(self._name)
+        self.__dict__.update(module.__dict__)
+        return module
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_lazy_module(self):
+        sys.modules.pop("colorsys", None)
+        colorsys = LazyModule("colorsys")
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual((0.0, 0.0, 1.0), colorsys.rgb_to_hsv(1.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+        self.assertIn("rgb_to_hsv", colorsys.__dict__)
+
+    def test_missing_module(self):
+        missing = LazyModule("local.missing_module")
+        with self.assertRaises(ModuleNotFoundError):
+            missing.anything
@@ -1,11 +1,16 @@
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Optional, Tuple
 from functools import reduce
 from operator import mul
 from local.ec.core import MAX_COORDINATE, NUMBER_POINTS
+from local.lazy import LazyModule
+from local import rng
 import random
 import math
+import multiprocessing
 import unittest
 
+np = LazyModule("numpy")
+
 
 def miller_rabin(n: int, k: int) -> bool:
     """
@@ -78,11 +83,354 @@ def trial_division(n: int) -> bool:
     return True
 
 
+SMALL_PRIME_BOUND = 1000
+"""
+Bound (exclusive) of the table of small primes.
+"""
+SMALL_PRIMES = tuple(n for n in range(SMALL_PRIME_BOUND) if trial_division(n))
+"""
+Table of small primes; used to filter out most composite numbers with a single gcd.
+"""
+SMALL_PRIMORIAL = reduce(mul, SMALL_PRIMES, 1)
+"""
+Product of all small primes.
+"""
+MILLER_RABIN_WITNESSES = [
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+]
+"""
+Bases of the Miller-Rabin test that are sufficient for all n below the bound (exclusive).
+
+Every composite number below the bound fails the test for at least one of the bases.
+https://en.wikipedia.org/wiki/Miller%E2%80%93Rabin_primality_test#Testing_against_small_sets_of_bases
+"""
+
+
+def strong_probable_prime(n: int, a: int) -> bool:
+    """
+    Return whether odd n > 2 passes a single round of the Miller-Rabin test to base a.
+
+    Primes always pass. Composites pass for at most a quarter of all bases.
+    """
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        s += 1
+        d //= 2
+
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = pow(x, 2, n)
+        if x == n - 1:
+            return True
+    return False
+
+
+def jacobi_symbol(a: int, n: int) -> int:
+    """
+    Return the Jacobi symbol (a / n) for odd n > 0.
+
+    https://en.wikipedia.org/wiki/Jacobi_symbol#Calculating_the_Jacobi_symbol
+    """
+    a %= n
+    result = 1
+    while a != 0:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_lucas_probable_prime(n: int) -> bool:
+    """
+    Return whether odd n > 2 passes the strong Lucas test.
+
+    The parameters are chosen using the method of Selfridge:
+    D is the first of 5, -7, 9, -11, ... such that (D / n) = -1, P = 1 and Q = (1 - D) / 4.
+
+    https://en.wikipedia.org/wiki/Lucas_pseudoprime#Strong_Lucas_pseudoprimes
+    """
+    if math.isqrt(n) ** 2 == n:
+        # There is no suitable D for perfect squares
+        return False
+
+    d = 5
+    while True:
+        j = jacobi_symbol(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+
+    def half(x: int) -> int:
+        # Division by 2 modulo odd n
+        x %= n
+        return (x + n) // 2 if x % 2 else x // 2
+
+    # Factor out powers of 2 such that n + 1 = k * 2^s with k odd
+    k, s = n + 1, 0
+    while k % 2 == 0:
+        s += 1
+        k //= 2
+
+    # Compute U_k, V_k and Q^k by going through the bits of k
+    u, v, q_k = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * q_k) % n
+        q_k = q_k * q_k % n
+        if bit == "1":
+            u, v = half(p * u + v), half(d * u + p * v)
+            q_k = q_k * q % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * q_k) % n
+        if v == 0:
+            return True
+        q_k = q_k * q_k % n
+    return False
+
+
+def baillie_psw(n: int) -> bool:
+    """
+    Return whether odd n > 2 passes the Baillie-PSW test.
+
+    This is a Miller-Rabin test to base 2 followed by a strong Lucas test.
+    No composite number is known to pass both tests.
+    https://en.wikipedia.org/wiki/Baillie%E2%80%93PSW_primality_test
+    """
+    return strong_probable_prime(n, 2) and strong_lucas_probable_prime(n)
+
+
+SEGMENT_SPAN = 2 ** 21
+"""
+Number of integers that are covered by one segment of the sieve.
+
+Only odd integers are stored, one bit each, so a segment takes SEGMENT_SPAN / 16 bytes.
+The working array of a segment (one byte per odd integer) fits into the CPU cache.
+"""
+
+
+class PrimeSieve:
+    """
+    Segmented sieve of Eratosthenes that remembers all primes it found.
+
+    The sieve covers all integers from 0 up to a bound (exclusive).
+    It grows one segment at a time when larger primes are requested.
+    Only odd integers are stored, as one bit each,
+    so covering all integers up to 10^9 takes about 60 MB.
+
+    Ranges that start past the bound are sieved on their own, one segment at a time, and are not remembered.
+    Only the primes up to the square root of the end of the range are needed for this,
+    so a small range far out (such as around 10^11) is cheap.
+
+    https://en.wikipedia.org/wiki/Sieve_of_Eratosthenes#Segmented_sieve
+    """
+    segment_span: int
+    """
+    Number of integers that are covered by one segment
+    """
+    segments: "List[np.ndarray]"
+    """
+    Segment i covers the integers from i * segment_span (inclusive) to (i + 1) * segment_span (exclusive).
+    Bit j (little endian) of a segment says whether integer i * segment_span + 2 * j + 1 is prime.
+    """
+
+    def __init__(self, segment_span: int = SEGMENT_SPAN):
+        if segment_span % 16 != 0:
+            raise ValueError("Segment span must be a multiple of 16")
+        self.segment_span = segment_span
+        self.segments = []
+
+    def bound(self) -> int:
+        """
+        Return the bound (exclusive) of the integers that the sieve covers.
+        """
+        return len(self.segments) * self.segment_span
+
+    def extend(self, bound: int):
+        """
+        Grow the sieve until it covers all integers up to the bound (exclusive).
+        """
+        n_segments = -(-bound // self.segment_span)
+        if n_segments <= len(self.segments):
+            return
+
+        end = n_segments * self.segment_span
+        base_primes = _simple_sieve(math.isqrt(end) + 1)[1:].tolist()
+
+        for start in range(self.bound(), end, self.segment_span):
+            odd = _sieve_odd(start, self.segment_span, base_primes)
+            self.segments.append(np.packbits(odd, bitorder="little"))
+
+    def contains(self, n: int) -> bool:
+        """
+        Return whether n is prime.
+
+        **n must be smaller than the bound of the sieve!**
+        """
+        if n % 2 == 0:
+            return n == 2
+        segment, offset = divmod(n, self.segment_span)
+        j = offset // 2
+        return bool((self.segments[segment][j >> 3] >> (j & 7)) & 1)
+
+    def chunks(self, a: int, b: int) -> "Iterator[np.ndarray]":
+        """
+        Yield the primes from a (inclusive) to b (exclusive) in increasing order, one array per segment.
+
+        If a is inside the sieve, the sieve is extended as necessary.
+        If a is past the bound of the sieve, only the range is sieved, and the sieve stays the same.
+        Use this to go through many primes without holding all of them in memory.
+        """
+        a = max(a, 0)
+        if b <= a:
+            return
+        if a <= 2 < b:
+            yield np.array([2], dtype=np.int64)
+        if a > self.bound():
+            yield from self._window_chunks(a, b)
+            return
+        self.extend(b)
+
+        for index in range(a // self.segment_span, -(-b // self.segment_span)):
+            start = index * self.segment_span
+            odd = np.unpackbits(self.segments[index], bitorder="little")
+            primes = start + 2 * np.flatnonzero(odd).astype(np.int64) + 1
+            lo, hi = np.searchsorted(primes, [a, b])
+            if lo < hi:
+                yield primes[lo:hi]
+
+    def _window_chunks(self, a: int, b: int) -> "Iterator[np.ndarray]":
+        """
+        Yield the odd primes from a (inclusive) to b (exclusive) without touching the stored segments.
+        """
+        base_primes = _simple_sieve(math.isqrt(b - 1) + 1)[1:].tolist()
+        start = a - a % 2
+        while start < b:
+            span = min(self.segment_span, b - start + (b - start) % 2)
+            odd = _sieve_odd(start, span, base_primes)
+            primes = start + 2 * np.flatnonzero(odd).astype(np.int64) + 1
+            lo, hi = np.searchsorted(primes, [a, b])
+            if lo < hi:
+                yield primes[lo:hi]
+            start += span
+
+    def primes_in_range(self, a: int, b: int) -> "np.ndarray":
+        """
+        Return an array of the primes from a (inclusive) to b (exclusive) in increasing order.
+
+        The sieve is extended as necessary (see `chunks`).
+        """
+        chunks = list(self.chunks(a, b))
+        if not chunks:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(chunks)
+
+
+def _sieve_odd(start: int, span: int, base_primes: List[int]) -> "np.ndarray":
+    """
+    Sieve the odd integers from start (inclusive, even) to start + span (exclusive, even).
+
+    :param start: first integer of the range
+    :param span: number of integers in the range
+    :param base_primes: odd primes in increasing order, at least up to the square root of start + span
+    :return: boolean array whose entry j says whether start + 2 * j + 1 is prime
+    """
+    odd = np.ones(span // 2, dtype=bool)
+    stop = start + span
+    for p in base_primes:
+        if p * p >= stop:
+            break
+        # First odd multiple of p inside the range that is not p itself
+        first = max(p * p, (start + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        odd[(first - start) // 2::p] = False
+    if start == 0:
+        odd[0] = False  # 1 is not prime
+    return odd
+
+
+def _simple_sieve(n: int) -> "np.ndarray":
+    """
+    Return an array of the primes below n using a plain (not segmented) sieve of Eratosthenes.
+    """
+    is_prime_ = np.ones(max(n, 2), dtype=bool)
+    is_prime_[:2] = False
+    for p in range(2, math.isqrt(n - 1) + 1 if n > 1 else 0):
+        if is_prime_[p]:
+            is_prime_[p * p::p] = False
+    return np.flatnonzero(is_prime_)
+
+
+GLOBAL_SIEVE = PrimeSieve()
+"""
+Global prime sieve.
+
+All primes that were ever requested are remembered here.
+"""
+
+
+def primes_up_to(n: int) -> "np.ndarray":
+    """
+    Return an array of the primes up to n (inclusive) in increasing order.
+
+    Uses the global prime sieve.
+    """
+    return GLOBAL_SIEVE.primes_in_range(2, n + 1)
+
+
+def primes_in_range(a: int, b: int) -> "np.ndarray":
+    """
+    Return an array of the primes from a (inclusive) to b (exclusive) in increasing order.
+
+    Uses the global prime sieve.
+    """
+    return GLOBAL_SIEVE.primes_in_range(a, b)
+
+
 def is_prime(n: int) -> bool:
     """
     Return whether n is prime.
+
+    Small numbers are looked up in the table of small primes.
+    Numbers that the global prime sieve already covers are looked up in the sieve.
+    Numbers with a small prime factor are filtered out using a single gcd.
+    Numbers below 3.3 * 10^24 run the Miller-Rabin test with a fixed set of bases, so the result is exact.
+    Larger numbers run the Baillie-PSW test.
     """
-    return miller_rabin(n, 5)
+    if n < SMALL_PRIME_BOUND:
+        return n in SMALL_PRIMES
+    if n < GLOBAL_SIEVE.bound():
+        return GLOBAL_SIEVE.contains(n)
+    if math.gcd(n, SMALL_PRIMORIAL) != 1:
+        return False
+    if n < SMALL_PRIME_BOUND ** 2:
+        return True
+
+    for bound, witnesses in MILLER_RABIN_WITNESSES:
+        if n < bound:
+            return all(strong_probable_prime(n, a) for a in witnesses)
+    return baillie_psw(n)
 
 
 def euler_totient(factors: Iterable[int]) -> int:
@@ -91,8 +439,12 @@ def euler_totient(factors: Iterable[int]) -> int:
 
     **The method assumes that the given factors are prime numbers!**
     """
-    n = reduce(mul, factors, 1)
-    return int(n * reduce(mul, [1 - 1 / p for p in set(factors)], 1))
+    factors = list(factors)
+    totient = reduce(mul, factors, 1)
+    # Exact integer version of n * product(1 - 1 / p)
+    for p in set(factors):
+        totient = totient // p * (p - 1)
+    return totient
 
 
 def is_coprime(a: int, factors: Iterable[int]) -> bool:
@@ -112,8 +464,30 @@ def get_coprimes(factors: Iterable[int]) -> List[int]:
 
     **The method assumes that the given factors are prime numbers!**
     """
+    return [a for chunk in coprime_chunks(factors) for a in chunk.tolist()]
+
+
+def coprime_chunks(factors: Iterable[int], chunk_size: int = 2 ** 20) -> "Iterator[np.ndarray]":
+    """
+    Yield the coprimes of integer n whose prime factorization is given, in increasing order, one array per chunk.
+
+    Each chunk covers chunk_size integers.
+    The multiples of each prime factor are struck out of a boolean mask, so there is no loop over integers.
+    Use this to go through the coprimes of large n without holding all of them in memory.
+
+    **The method assumes that the given factors are prime numbers!**
+    """
+    factors = list(factors)
     n = reduce(mul, factors, 1)
-    return [a for a in range(1, n) if is_coprime(a, factors)]
+    distinct = sorted(set(factors))
+
+    for start in range(1, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        mask = np.ones(stop - start, dtype=bool)
+        for p in distinct:
+            # Index of the first multiple of p that is at least start
+            mask[-start % p::p] = False
+        yield start + np.flatnonzero(mask)
 
 
 def get_coprime(factors: Iterable[int]) -> int:
@@ -129,6 +503,291 @@ def get_coprime(factors: Iterable[int]) -> int:
             return a
 
 
+def product_tree(values: List[int]) -> List[List[int]]:
+    """
+    Return the product tree of the values.
+
+    Level 0 holds the values themselves. Each level above holds the products of adjacent pairs of the level below.
+    The last level holds the product of all values.
+
+    :param values: list of integers (at least one)
+    :return: list of levels, from the leaves to the root
+    """
+    if not values:
+        raise ValueError("Need at least one value")
+    levels = [list(values)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([reduce(mul, level[i:i + 2]) for i in range(0, len(level), 2)])
+    return levels
+
+
+def remainder_tree(n: int, tree: List[List[int]], squared: bool = False) -> List[int]:
+    """
+    Return n modulo each leaf of the product tree (or modulo the square of each leaf).
+
+    Instead of dividing n by each leaf, n is reduced modulo each node from the root downwards.
+    The numbers shrink on the way down, so the large divisions only happen near the root.
+
+    :param n: integer to reduce
+    :param tree: product tree
+    :param squared: reduce modulo the squares of the nodes
+    :return: list of remainders, one for each leaf
+    """
+    remainders = [n]
+    for level in reversed(tree):
+        remainders = [remainders[i // 2] % (node * node if squared else node) for i, node in enumerate(level)]
+    return remainders
+
+
+def batch_gcd(moduli: List[int]) -> List[int]:
+    """
+    Return the gcd of each modulus with the product of all other moduli.
+
+    A result greater than one means that the modulus shares a prime factor with another modulus.
+    This is the attack on RSA keys with shared primes by Heninger et al.:
+    It checks all pairs of N moduli with a product tree and a remainder tree instead of N^2 gcds.
+    The trees take quasi-linear time with fast multiplication.
+    Python multiplies big integers with Karatsuba, so the speedup shows for thousands of moduli.
+
+    https://factorable.net/weakkeys12.extended.pdf (Section 3.3)
+
+    :param moduli: list of positive integers
+    :return: list of gcds
+    """
+    tree = product_tree(moduli)
+    # Modulo N_i^2, the product P of all moduli is N_i * (P / N_i mod N_i)
+    remainders = remainder_tree(tree[-1][0], tree, squared=True)
+    return [math.gcd(r // m, m) for r, m in zip(remainders, moduli)]
+
+
+def shared_factors(moduli: List[int]) -> List[Tuple[int, int, int]]:
+    """
+    Return all pairs of moduli that share a factor.
+
+    The batch gcd finds the few affected moduli first, so only those are compared pairwise.
+
+    :param moduli: list of positive integers
+    :return: list of (i, j, gcd of moduli i and j) with i < j
+    """
+    affected = [i for i, g in enumerate(batch_gcd(moduli)) if g > 1]
+    pairs = []
+    for a, i in enumerate(affected):
+        for j in affected[a + 1:]:
+            g = math.gcd(moduli[i], moduli[j])
+            if g > 1:
+                pairs.append((i, j, g))
+    return pairs
+
+
+def coprime_batch(candidates: List[int], n: int) -> List[bool]:
+    """
+    Return whether each candidate is coprime to n.
+
+    Computes n modulo each candidate with a single remainder tree,
+    so a large n is only reduced once instead of once per candidate.
+
+    :param candidates: list of positive integers
+    :param n: positive integer
+    :return: list of coprimality
+    """
+    if not candidates:
+        return []
+    remainders = remainder_tree(n, product_tree(candidates))
+    return [math.gcd(a, r) == 1 for a, r in zip(candidates, remainders)]
+
+
+PRIME_SEARCH_WINDOW = 4096
+"""
+Number of odd candidates that are sieved at once when searching for a random prime.
+"""
+
+
+def random_prime(bits: int) -> int:
+    """
+    Return a random prime with exactly the given number of bits.
+
+    Picks a random odd start and searches upwards for the next prime.
+    The candidates are sieved with the table of small primes first,
+    so the expensive primality test only runs on candidates without small factors.
+
+    Primes after large prime gaps are slightly more likely. This is fine for our purposes.
+
+    :param bits: number of bits (at least 2)
+    :return: random prime
+    """
+    if bits < 2:
+        raise ValueError("Primes have at least 2 bits")
+    lo, hi = 2 ** (bits - 1), 2 ** bits
+
+    if hi - lo <= 8 * PRIME_SEARCH_WINDOW:
+        # Small range: rejection sampling
+        while True:
+            candidate = rng.randrange(lo, hi)
+            if is_prime(candidate):
+                return candidate
+
+    odd_primes = SMALL_PRIMES[1:]
+    while True:
+        # Candidate k is start + 2 * k
+        start = rng.randrange(lo, hi - 2 * PRIME_SEARCH_WINDOW) | 1
+        mask = np.ones(PRIME_SEARCH_WINDOW, dtype=bool)
+        for p in odd_primes:
+            # Strike all k with start + 2 * k = 0 (mod p)
+            mask[-start * pow(2, -1, p) % p::p] = False
+        for k in np.flatnonzero(mask).tolist():
+            candidate = start + 2 * k
+            if is_prime(candidate):
+                return candidate
+
+
+def rsa_modulus(bits: int, n_factors: int = 2) -> Tuple[int, List[int]]:
+    """
+    Return a random composite number with exactly the given number of bits, together with its prime factors.
+
+    The factors are distinct primes of (almost) equal size, like in RSA.
+
+    :param bits: number of bits of the composite number
+    :param n_factors: number of prime factors
+    :return: composite number and sorted list of its prime factors
+    """
+    if n_factors < 1 or bits < 2 * n_factors:
+        raise ValueError("Too few bits for the number of factors")
+    sizes = [bits // n_factors + (1 if i < bits % n_factors else 0) for i in range(n_factors)]
+
+    while True:
+        factors = sorted(random_prime(size) for size in sizes)
+        n = reduce(mul, factors, 1)
+        if n.bit_length() == bits and len(set(factors)) == n_factors:
+            return n, factors
+
+
+def is_prime_batch(numbers: Iterable[int], workers: int = 1) -> List[bool]:
+    """
+    Return whether each of the numbers is prime.
+
+    Numbers that fit into 64 bits are divided by each small prime at once using NumPy.
+    This filters out most composite numbers before the expensive primality test.
+    The filter keeps a single mask of composite numbers, so memory stays proportional to the number of inputs.
+
+    :param numbers: numbers to test
+    :param workers: number of worker processes for the remaining tests; 1 means no pool
+    :return: list of primality
+    """
+    numbers = list(numbers)
+    result: List[Optional[bool]] = [None] * len(numbers)
+
+    small = [i for i, n in enumerate(numbers) if SMALL_PRIME_BOUND <= n < 2 ** 63]
+    if small:
+        values = np.array([numbers[i] for i in small], dtype=np.int64)
+        has_factor = np.zeros(len(values), dtype=bool)
+        for p in SMALL_PRIMES:
+            has_factor |= values % p == 0
+        for i, composite in zip(small, has_factor.tolist()):
+            if composite:
+                result[i] = False
+
+    remaining = [i for i, value in enumerate(result) if value is None]
+    tasks = [numbers[i] for i in remaining]
+    if workers == 1:
+        tested = list(map(is_prime, tasks))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            tested = pool.map(is_prime, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+    for i, value in zip(remaining, tested):
+        result[i] = value
+
+    return result
+
+
+def pollard_brent(n: int) -> int:
+    """
+    Return a nontrivial divisor of the composite number n.
+
+    Uses Brent's variant of Pollard's rho algorithm:
+    The pseudorandom sequence y -> y^2 + c modulo n eventually cycles modulo each prime factor p of n,
+    after about sqrt(p) steps. Cycles are detected with Brent's method,
+    and the differences are multiplied together, so there is only one gcd per batch of steps.
+
+    https://en.wikipedia.org/wiki/Pollard%27s_rho_algorithm#Variants
+    https://maths-people.anu.edu.au/~brent/pd/rpb051i.pdf
+
+    **n must be composite, otherwise the loop runs forever!**
+    """
+    if n % 2 == 0:
+        return 2
+
+    batch = 128
+    while True:
+        y, c = rng.randrange(1, n), rng.randrange(1, n)
+        g, r, q = 1, 1, 1
+        x = ys = y
+
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+
+        if g == n:
+            # The batch overshot: Redo it one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+
+        # Retry with different parameters if the sequence cycled modulo n itself
+        if g != n:
+            return g
+
+
+def factor(n: int, workers: int = 1) -> List[int]:
+    """
+    Return the prime factorization of n as a sorted list of primes.
+
+    Small prime factors are removed by trial division.
+    Larger factors are split off with Pollard's rho algorithm until only primes remain.
+    Splitting off a prime factor p takes about sqrt(p) steps.
+    Factors of 40 bits take about a second, factors of 48 bits a few seconds, while RSA moduli remain safe.
+
+    :param n: positive integer
+    :param workers: number of worker processes that split several composite factors in parallel; 1 means no pool
+    :return: sorted list of prime factors (with multiplicity)
+    """
+    if n < 1:
+        raise ValueError("Can only factor positive integers")
+
+    factors = []
+    for p in SMALL_PRIMES:
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    composites = [n] if n > 1 else []
+    pool = multiprocessing.Pool(workers) if workers != 1 else None
+    try:
+        while composites:
+            primes = [m for m in composites if is_prime(m)]
+            factors.extend(primes)
+            composites = [m for m in composites if not is_prime(m)]
+
+            divisors = pool.map(pollard_brent, composites) if pool else list(map(pollard_brent, composites))
+            composites = [part for m, d in zip(composites, divisors) for part in (d, m // d)]
+    finally:
+        if pool:
+            pool.terminate()
+
+    return sorted(factors)
+
+
 class TestPrimes(unittest.TestCase):
     primes = [
         2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97,
@@ -167,6 +826,101 @@ class TestPrimes(unittest.TestCase):
             if probably_prime and (not provably_prime):
                 print("false positive: {}".format(n))
 
+    def test_is_prime(self):
+        for n in range(-10, 20000):
+            self.assertEqual(trial_division(n), is_prime(n))
+
+    def test_is_prime_pseudoprimes(self):
+        # Strong pseudoprimes to base 2, Carmichael numbers, strong pseudoprime to all bases up to 37
+        composites = [2047, 3277, 4033, 561, 41041, 825265, 3215031751, 3825123056546413051,
+                      318665857834031151167461, (2 ** 61 - 1) * (2 ** 89 - 1)]
+        for n in composites:
+            self.assertFalse(is_prime(n))
+        # Strong Lucas pseudoprimes
+        for n in (5459, 5777, 10877, 16109, 18971):
+            self.assertTrue(strong_lucas_probable_prime(n))
+            self.assertFalse(is_prime(n))
+
+    def test_is_prime_big(self):
+        for exponent in (31, 61, 89, 107, 127, 521):
+            self.assertTrue(is_prime(2 ** exponent - 1))
+            self.assertTrue(baillie_psw(2 ** exponent - 1))
+        for exponent in (67, 101, 257):
+            self.assertFalse(is_prime(2 ** exponent - 1))
+
+    def test_primes_up_to(self):
+        self.assertEqual(self.primes, primes_up_to(997).tolist())
+        self.assertEqual(self.primes, primes_up_to(1000).tolist())
+        self.assertEqual([], primes_up_to(1).tolist())
+        self.assertEqual(78498, len(primes_up_to(10 ** 6)))
+
+    def test_prime_sieve(self):
+        sieve = PrimeSieve(segment_span=64)
+        # A range past the bound is sieved on its own
+        self.assertEqual([p for p in self.primes if 50 <= p < 300], sieve.primes_in_range(50, 300).tolist())
+        self.assertEqual(0, sieve.bound())
+        self.assertEqual([p for p in self.primes if p < 300], sieve.primes_in_range(0, 300).tolist())
+        self.assertEqual(320, sieve.bound())
+        self.assertEqual(self.primes, sieve.primes_in_range(0, 1000).tolist())
+        for n in range(1000):
+            self.assertEqual(n in self.primes, sieve.contains(n))
+
+        # Primes across many segments
+        expected = [n for n in range(10 ** 4, 2 * 10 ** 4) if trial_division(n)]
+        self.assertEqual(expected, np.concatenate(list(sieve.chunks(10 ** 4, 2 * 10 ** 4))).tolist())
+        self.assertEqual(1024, sieve.bound())
+        self.assertEqual(expected, sieve.primes_in_range(10 ** 4 - 1, 2 * 10 ** 4 + 1).tolist())
+
+    def test_sieve_far_window(self):
+        sieve = PrimeSieve()
+        a = 10 ** 11
+        expected = [n for n in range(a, a + 1000) if is_prime(n)]
+        self.assertEqual(expected, sieve.primes_in_range(a, a + 1000).tolist())
+        self.assertEqual(expected[1:], sieve.primes_in_range(expected[0] + 1, a + 1000).tolist())
+        self.assertEqual(0, sieve.bound())
+
+    def test_random_prime(self):
+        for bits in (2, 3, 8, 16, 64, 256):
+            for _ in range(5):
+                p = random_prime(bits)
+                self.assertEqual(bits, p.bit_length())
+                self.assertTrue(is_prime(p))
+
+    def test_rsa_modulus(self):
+        for bits, n_factors in ((64, 2), (256, 2), (100, 3)):
+            n, factors = rsa_modulus(bits, n_factors)
+            self.assertEqual(bits, n.bit_length())
+            self.assertEqual(n_factors, len(set(factors)))
+            self.assertEqual(n, reduce(mul, factors, 1))
+            self.assertTrue(all(is_prime(p) for p in factors))
+
+    def test_is_prime_batch(self):
+        numbers = list(range(-5, 3000)) + [2 ** 61 - 1, 2 ** 61 + 1, 2 ** 89 - 1, 2 ** 101 - 1]
+        expected = [is_prime(n) for n in numbers]
+        self.assertEqual(expected, is_prime_batch(numbers))
+        self.assertEqual(expected, is_prime_batch(numbers, workers=2))
+
+    def test_factor(self):
+        for n in range(1, 2000):
+            self.assertEqual(n, reduce(mul, factor(n), 1))
+            self.assertTrue(all(is_prime(p) for p in factor(n)))
+
+        p, q, r = random_prime(32), random_prime(40), random_prime(24)
+        self.assertEqual(sorted([p, q, q, r, 3]), factor(3 * p * q * q * r))
+        self.assertEqual(sorted([p, q, r]), factor(p * q * r, workers=2))
+
+    def test_batch_gcd(self):
+        p, q, r, s, t = (random_prime(64) for _ in range(5))
+        moduli = [p * q, r * s, q * t, random_prime(128) * 3]
+        self.assertEqual([q, 1, q, 1], batch_gcd(moduli))
+        self.assertEqual([(0, 2, q)], shared_factors(moduli))
+        self.assertEqual([1], batch_gcd([p * q]))
+
+    def test_coprime_batch(self):
+        n = 2 ** 3 * 3 * 5 ** 2 * 101
+        candidates = list(range(1, 1000))
+        self.assertEqual([math.gcd(a, n) == 1 for a in candidates], coprime_batch(candidates, n))
+
     def test_max_coordinate_is_prime(self):
         self.assertTrue(is_prime(MAX_COORDINATE))
 
@@ -187,6 +941,18 @@ class TestPrimes(unittest.TestCase):
                         break
                     self.assertEqual(self.euler_totients[a * b * c - 1], euler_totient([a, b, c]))
 
+    def test_euler_totient_big(self):
+        p, q = 2 ** 61 - 1, 2 ** 89 - 1
+        self.assertEqual((p - 1) * (q - 1), euler_totient([p, q]))
+        self.assertEqual(p * (p - 1) * (q - 1), euler_totient([p, p, q]))
+
+    def test_coprime_chunks(self):
+        factors = [2, 3, 3, 7, 11]
+        n = reduce(mul, factors, 1)
+        expected = [i for i in range(n) if math.gcd(i, n) == 1]
+        self.assertEqual(expected, np.concatenate(list(coprime_chunks(factors, chunk_size=100))).tolist())
+        self.assertEqual(euler_totient(factors), sum(len(chunk) for chunk in coprime_chunks(factors, 7)))
+
     def test_get_coprimes(self):
         primes = [p for p in self.primes if p < 100]
 
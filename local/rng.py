@@ -0,0 +1,360 @@
+from typing import Dict, List, MutableSequence, Optional, Union
+from local.lazy import LazyModule
+import unittest
+import multiprocessing
+import os
+
+np = LazyModule("numpy")
+
+BUFFER_SIZE = 4096
+"""
+Number of random values that are drawn at once.
+
+Drawing values in bulk is much faster than drawing them one by one.
+"""
+MAX_BUFFERS = 64
+"""
+Maximum number of buffers of each kind (range widths, permutation lengths) that a source keeps.
+
+When a new buffer is needed, the buffer that was filled longest ago is discarded.
+"""
+MAX_BUFFERED = 2 ** 63
+"""
+Upper bound (exclusive) of ranges that are served from buffers.
+
+Larger ranges don't fit into NumPy integers; they are drawn from random bytes instead.
+"""
+
+Seed = Union[None, int, "np.random.SeedSequence"]
+
+
+def _store(buffers: Dict[int, List], key: int, buffer: List):
+    # Dictionaries keep insertion order, so the first key belongs to the buffer that was filled longest ago
+    buffers.pop(key, None)
+    while len(buffers) >= MAX_BUFFERS:
+        del buffers[next(iter(buffers))]
+    buffers[key] = buffer
+
+
+class RandomSource:
+    """
+    Source of uniform randomness that draws values in bulk.
+
+    Calling `random.randrange` or `random.shuffle` for each value is slow.
+    This class draws large buffers of values from a NumPy generator and hands them out one by one.
+
+    Each range has its own buffer, so values are uniform and unbiased.
+    The first value of each range is drawn on its own, so ranges that are used only once
+    (such as random starting points modulo different numbers) don't fill buffers.
+    At most `MAX_BUFFERS` buffers are kept.
+
+    Without a seed, the source is seeded with fresh entropy from the operating system.
+    With a seed, the source always returns the same values in the same order.
+
+    NumPy is only imported when the first value is drawn.
+    """
+    initial_seed: Seed
+    """
+    Seed that the source was reset to.
+    """
+    _seed_sequence: "Optional[np.random.SeedSequence]"
+    _generator: "Optional[np.random.Generator]"
+    integers: Dict[int, List[int]]
+    """
+    Maps each range width to a buffer of integers inside this range (at most `MAX_BUFFERS` widths).
+    """
+    permutations: Dict[int, List[List[int]]]
+    """
+    Maps each length to a buffer of permutations of this length (at most `MAX_BUFFERS` lengths).
+    """
+
+    def __init__(self, seed: Seed = None):
+        self.seed(seed)
+
+    def seed(self, seed: Seed = None):
+        """
+        Reset the source to the given seed.
+
+        All buffered values are discarded.
+
+        :param seed: integer seed, seed sequence, or None for fresh entropy
+        """
+        self.initial_seed = seed
+        self._seed_sequence = None
+        self._generator = None
+        self.integers = {}
+        self.permutations = {}
+
+    @property
+    def seed_sequence(self) -> "np.random.SeedSequence":
+        """
+        Return the seed of the source; used to spawn independent child sources.
+        """
+        if self._seed_sequence is None:
+            seed = self.initial_seed
+            if not isinstance(seed, np.random.SeedSequence):
+                seed = np.random.SeedSequence(seed)
+            self._seed_sequence = seed
+        return self._seed_sequence
+
+    @property
+    def generator(self) -> "np.random.Generator":
+        """
+        Return the generator that fills the buffers.
+        """
+        if self._generator is None:
+            self._generator = np.random.default_rng(self.seed_sequence)
+        return self._generator
+
+    def spawn(self, n: int) -> "List[RandomSource]":
+        """
+        Return n independent child sources.
+
+        Use this to give each worker its own reproducible source.
+
+        :param n: number of children
+        :return: list of child sources
+        """
+        return [RandomSource(child) for child in self.seed_sequence.spawn(n)]
+
+    def randbits(self, k: int) -> int:
+        """
+        Return a uniformly random integer with k random bits.
+        """
+        if k <= 0:
+            return 0
+        n_bytes = (k + 7) // 8
+        x = int.from_bytes(self.generator.bytes(n_bytes), byteorder="big")
+        return x >> (n_bytes * 8 - k)
+
+    def randbelow(self, n: int) -> int:
+        """
+        Return a uniformly random integer from 0 (inclusive) to n (exclusive).
+        """
+        if n <= 0:
+            raise ValueError("Empty range")
+        if n >= MAX_BUFFERED:
+            # Rejection sampling: Each attempt succeeds with probability greater than one half
+            k = n.bit_length()
+            while True:
+                x = self.randbits(k)
+                if x < n:
+                    return x
+
+        buffer = self.integers.get(n)
+        if buffer is None:
+            # Only buffer a range when it is used again
+            _store(self.integers, n, [])
+            return int(self.generator.integers(0, n))
+        if not buffer:
+            buffer = self.generator.integers(0, n, size=BUFFER_SIZE).tolist()
+            _store(self.integers, n, buffer)
+        return buffer.pop()
+
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        """
+        Return a uniformly random integer from the range.
+
+        Works like `random.randrange` without a step.
+
+        :param start: start of the range (inclusive), or end of the range if stop is omitted
+        :param stop: end of the range (exclusive)
+        :return: random integer
+        """
+        if stop is None:
+            return self.randbelow(start)
+        return start + self.randbelow(stop - start)
+
+    def randrange_bulk(self, n: int, count: int) -> List[int]:
+        """
+        Return a list of uniformly random integers from 0 (inclusive) to n (exclusive).
+
+        :param n: end of the range (exclusive)
+        :param count: number of integers
+        :return: list of random integers
+        """
+        if n >= MAX_BUFFERED:
+            return [self.randbelow(n) for _ in range(count)]
+        return self.generator.integers(0, n, size=count).tolist()
+
+    def permutation(self, n: int) -> List[int]:
+        """
+        Return a uniformly random permutation of the integers from 0 to n - 1.
+        """
+        buffer = self.permutations.get(n)
+        if not buffer:
+            count = max(1, BUFFER_SIZE // max(1, n))
+            buffer = self.permutations_bulk(n, count)
+            _store(self.permutations, n, buffer)
+        return buffer.pop()
+
+    def permutations_bulk(self, n: int, count: int) -> List[List[int]]:
+        """
+        Return a list of uniformly random permutations of the integers from 0 to n - 1.
+
+        :param n: length of each permutation
+        :param count: number of permutations
+        :return: list of random permutations
+        """
+        identity = np.tile(np.arange(n), (count, 1))
+        return self.generator.permuted(identity, axis=1).tolist()
+
+    def shuffle(self, lst: MutableSequence):
+        """
+        Shuffle the list in place.
+
+        Works like `random.shuffle`.
+        """
+        permutation = self.permutation(len(lst))
+        lst[:] = [lst[i] for i in permutation]
+
+
+GLOBAL_SOURCE = RandomSource()
+"""
+Global source of randomness.
+
+All random scalars, points and shufflings go through this source.
+
+Like the `random` module, the global source is reseeded with fresh entropy in each forked child process,
+so worker processes don't hand out the same buffered values (such as blinding factors).
+Seed it again inside the child for reproducible results.
+"""
+
+
+def _reseed_after_fork():
+    GLOBAL_SOURCE.seed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+def set_source(source: RandomSource):
+    """
+    Replace the global source of randomness.
+    """
+    global GLOBAL_SOURCE
+    GLOBAL_SOURCE = source
+
+
+def seed(s: Seed = None):
+    """
+    Reset the global source to the given seed.
+    """
+    GLOBAL_SOURCE.seed(s)
+
+
+def randbits(k: int) -> int:
+    """
+    Return a uniformly random integer with k random bits from the global source.
+    """
+    return GLOBAL_SOURCE.randbits(k)
+
+
+def randrange(start: int, stop: Optional[int] = None) -> int:
+    """
+    Return a uniformly random integer from the range using the global source.
+    """
+    return GLOBAL_SOURCE.randrange(start, stop)
+
+
+def permutation(n: int) -> List[int]:
+    """
+    Return a uniformly random permutation of the integers from 0 to n - 1 using the global source.
+    """
+    return GLOBAL_SOURCE.permutation(n)
+
+
+def shuffle(lst: MutableSequence):
+    """
+    Shuffle the list in place using the global source.
+    """
+    GLOBAL_SOURCE.shuffle(lst)
+
+
+def _draw_into(queue: "multiprocessing.Queue"):
+    queue.put([randrange(2 ** 32) for _ in range(8)] + [permutation(10)])
+
+
+class TestRandomSource(unittest.TestCase):
+    def test_randrange(self):
+        source = RandomSource()
+        for n in (1, 2, 13, 1000):
+            for _ in range(2 * BUFFER_SIZE):
+                self.assertTrue(0 <= source.randrange(n) < n)
+        for _ in range(100):
+            self.assertTrue(5 <= source.randrange(5, 8) < 8)
+
+    def test_bounded_buffers(self):
+        source = RandomSource(0)
+        for n in range(1000, 2000):
+            self.assertTrue(1 <= source.randrange(1, n) < n)
+        self.assertTrue(len(source.integers) <= MAX_BUFFERS)
+        # Ranges that were used once hold no buffered values
+        self.assertEqual(0, sum(len(buffer) for buffer in source.integers.values()))
+
+        for _ in range(3):
+            source.randrange(13)
+        self.assertEqual(BUFFER_SIZE - 2, len(source.integers[13]))
+        for n in range(MAX_BUFFERS + 10):
+            source.permutation(n)
+        self.assertEqual(MAX_BUFFERS, len(source.permutations))
+
+    def test_fork(self):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("Needs fork")
+        context = multiprocessing.get_context("fork")
+        # Fill the buffer before forking
+        randrange(2 ** 32)
+        queue = context.Queue()
+        children = [context.Process(target=_draw_into, args=(queue,)) for _ in range(2)]
+        for child in children:
+            child.start()
+        draws = [queue.get(timeout=60) for _ in children]
+        for child in children:
+            child.join()
+        self.assertNotEqual(draws[0], draws[1])
+
+    def test_randrange_big(self):
+        source = RandomSource()
+        n = 2 ** 200 + 12345
+        for _ in range(100):
+            self.assertTrue(0 <= source.randrange(n) < n)
+        self.assertTrue(source.randbits(1024) < 2 ** 1024)
+
+    def test_uniform(self):
+        source = RandomSource(0)
+        counts = [0] * 13
+        for x in source.randrange_bulk(13, 13000):
+            counts[x] += 1
+        for count in counts:
+            self.assertTrue(800 < count < 1200)
+
+    def test_seed(self):
+        first = RandomSource(42)
+        second = RandomSource(42)
+        self.assertIsNone(first._generator)
+        self.assertEqual([first.randrange(100) for _ in range(10)], [second.randrange(100) for _ in range(10)])
+        self.assertEqual(first.permutation(10), second.permutation(10))
+
+        first.seed(7)
+        second.seed(7)
+        self.assertEqual(first.randbits(256), second.randbits(256))
+
+    def test_spawn(self):
+        first, second = [child.randbits(128) for child in RandomSource(42).spawn(2)]
+        again, _ = [child.randbits(128) for child in RandomSource(42).spawn(2)]
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, again)
+
+    def test_permutation(self):
+        source = RandomSource()
+        for n in (0, 1, 5, 100):
+            for _ in range(10):
+                self.assertEqual(list(range(n)), sorted(source.permutation(n)))
+
+    def test_shuffle(self):
+        source = RandomSource()
+        lst = ["a", "b", "c", "d"]
+        source.shuffle(lst)
+        self.assertEqual(["a", "b", "c", "d"], sorted(lst))
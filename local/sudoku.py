@@ -2,8 +2,8 @@ import math
 import random
 import unittest
 import logging
-from typing import List, Tuple, Iterator
-from local.exact_cover import Matrix
+from typing import List, Optional, Tuple, Iterator
+from local.exact_cover import Matrix, SearchStats
 
 
 class Board:
@@ -178,15 +178,19 @@ class Board:
 
         return matrix
 
-    def solve(self) -> "Board":
+    def solve(self, engine: str = "dict", stats: Optional[SearchStats] = None) -> "Board":
         """
         Fill in the empty cells on the board to form a Sudoku solution.
 
+        :param engine: exact cover solver (see `Matrix.compile`)
+        :param stats: measure the search, for instance to compare the difficulty of boards
         :return: Sudoku solution
         """
         matrix = self.to_matrix()
         logging.info(f"Solving {len(matrix.rows)} elements and {len(matrix.cols)} constraints")
-        assignment = next(matrix.algorithm_x([]))
+        assignment = next(matrix.compile(engine).algorithm_x([], stats=stats))
+        if stats is not None:
+            logging.info(f"Search: {stats}")
         rows = [row.copy() for row in self.rows]
 
         for assigned_row in assignment:
@@ -210,15 +214,62 @@ class Board:
 
         return Board(rows)
 
-    def to_puzzle(self) -> "Board":
+    def presets(self) -> List[Tuple[int, int, int]]:
+        """
+        Return the nonzero cells as rows of the exact cover instance (see `to_matrix`).
+        """
+        return [(row, col, value) for row, columns in enumerate(self.rows) for col, value in enumerate(columns) if value > 0]
+
+    def count_solutions(self, limit: Optional[int] = None, engine: str = "dlx") -> int:
+        """
+        Count the Sudoku solutions that agree with the board.
+
+        :param limit: stop counting at this number of solutions; 2 tells whether the solution is unique
+        :param engine: exact cover solver (see `Matrix.compile`)
+        :return: number of solutions (at most limit)
+        """
+        return self.to_matrix().compile(engine).count_solutions(limit)
+
+    def to_puzzle(self, unique: bool = False, engine: str = "dlx") -> "Board":
         """
         Convert a complete Sudoku solution into a partial solution by removing values.
 
+        By default, values are removed at random until 20% of the cells are left as clues.
+        The puzzle may have other solutions than this board.
+
+        With unique=True, cells are removed one by one in random order,
+        and each removal is undone if the puzzle no longer has a unique solution.
+        Removing stops at 20% clues or when no cell can be removed, so there may be more clues.
+        The exact cover instance of the blank board is compiled once;
+        each uniqueness check forces the clues and stops counting at the second solution.
+
+        :param unique: keep the solution unique
+        :param engine: exact cover solver for the uniqueness checks (see `Matrix.compile`)
         :return: partial solution (copy)
         """
         n_clues = math.ceil(self.dim_sq ** 2 * 0.2)
-        logging.info(f"Sudoku with {n_clues} clues")
-        return self.remove_values(self.dim_sq ** 2 - n_clues)
+        if not unique:
+            logging.info(f"Sudoku with {n_clues} clues")
+            return self.remove_values(self.dim_sq ** 2 - n_clues)
+
+        solver = Board.blank(self.dim).to_matrix().compile(engine)
+        puzzle = Board([row.copy() for row in self.rows])
+        cells = [(row, col) for row in range(self.dim_sq) for col in range(self.dim_sq)]
+        random.shuffle(cells)
+        remaining = len(cells)
+
+        for row, col in cells:
+            if remaining <= n_clues:
+                break
+            value = puzzle.rows[row][col]
+            puzzle.rows[row][col] = 0
+            if solver.count_solutions(2, forced_rows=puzzle.presets()) == 1:
+                remaining -= 1
+            else:
+                puzzle.rows[row][col] = value
+
+        logging.info(f"Sudoku with {remaining} clues and a unique solution")
+        return puzzle
 
     def falsify_row(self):
         """
@@ -292,7 +343,17 @@ class TestBoard(unittest.TestCase):
 
         https://www.flickr.com/photos/npcomplete/2361922699
         """
-        solved = hard.solve()
+        stats = SearchStats()
+        solved = hard.solve(stats=stats)
+        assert solved.verify()
+        # Hard for brute force, but Algorithm X fills in one empty cell per level
+        self.assertEqual(64, stats.max_depth)
+        self.assertEqual(solved.rows, hard.solve("dlx").rows)
+        self.assertEqual(solved.rows, hard.solve("bitset").rows)
+
+    def test_solve_dlx(self):
+        board = Board.random(4)
+        solved = board.solve("dlx")
         assert solved.verify()
 
     def test_falsify_verify(self):
@@ -305,3 +366,17 @@ class TestBoard(unittest.TestCase):
         board = Board.random(3)
         solved = board.solve()
         solved.falsify(40)
+
+    def test_count_solutions(self):
+        board = Board.random(3).solve()
+        self.assertEqual(1, board.count_solutions())
+        self.assertEqual(2, Board.blank(2).count_solutions(2))
+        self.assertEqual(288, Board.blank(2).count_solutions(engine="dict"))
+        self.assertEqual(288, Board.blank(2).count_solutions(engine="bitset"))
+
+    def test_unique_puzzle(self):
+        solution = Board.random(3).solve()
+        puzzle = solution.to_puzzle(unique=True)
+        self.assertEqual(1, puzzle.count_solutions(2))
+        self.assertEqual(solution.rows, puzzle.solve("dlx").rows)
+        self.assertTrue(len(puzzle.presets()) < 40)